@@ -0,0 +1,148 @@
+"""Micro-batching queue for TTS synthesis.
+
+Concurrent requests (and the chunks of a single long request) are coalesced
+over a short window and decoded together by one batched engine call:
+``TTSEngine.synthesize_batch`` for built-in speakers, or
+``TTSEngine.synthesize_clone_requests`` for voice cloning. Requests are
+grouped into text-length buckets so short prompts aren't padded out to the
+longest one in the window.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import structlog
+
+from coqui_service.engine import TTSEngine
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class _BatchItem:
+    """A queued synthesis request and the future its caller awaits."""
+
+    text: str
+    voice: Any  # speaker_id, or the conditioning latents for cloning
+    language: str
+    future: asyncio.Future
+
+
+class TTSBatcher:
+    """Coalesces synthesis requests into batched GPT decodes."""
+
+    def __init__(
+        self,
+        engine: TTSEngine,
+        max_batch_size: int = 8,
+        window_ms: float = 15.0,
+        bucket_limits: Tuple[int, ...] = (64, 128, 256),
+        synthesize_fn: Optional[
+            Callable[[List[Tuple[str, Any, str]]], List[Union[bytes, Exception]]]
+        ] = None,
+        executor: Optional[Executor] = None,
+    ):
+        self.engine = engine
+        # Batched engine call taking (text, voice, language) tuples; returns
+        # PCM bytes, or an exception for an item that failed on its own
+        self.synthesize_fn = synthesize_fn or engine.synthesize_batch
+        # Where the blocking decode runs; the default loop pool if not given
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.window_s = window_ms / 1000.0
+        self.bucket_limits = bucket_limits
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the consumer task on the running event loop (idempotent)."""
+        if self._task is not None and not self._task.done():
+            return
+
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self.run())
+        logger.info(
+            "batcher.started",
+            max_batch_size=self.max_batch_size,
+            window_ms=self.window_s * 1000,
+        )
+
+    async def submit(self, text: str, voice: Any, language: str = "en") -> bytes:
+        """Queue a synthesis request and wait for its PCM16 bytes.
+
+        Args:
+            text: Text to synthesize
+            voice: Built-in speaker_id, or (gpt_cond_latent, speaker_embedding)
+                for cloning
+            language: Language code
+        """
+        self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_BatchItem(text, voice, language, future))
+        return await future
+
+    async def run(self) -> None:
+        """Consumer loop: collect a window of requests and decode per bucket."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            items = [await self._queue.get()]
+
+            # Coalescing window: gather whatever arrives in the next few ms
+            deadline = loop.time() + self.window_s
+            while len(items) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            for bucket in self._bucketize(items).values():
+                await self._run_batch(bucket)
+
+    def _bucketize(self, items: List[_BatchItem]) -> Dict[int, List[_BatchItem]]:
+        """Group items by text length so padding waste stays bounded."""
+        buckets: Dict[int, List[_BatchItem]] = {}
+        for item in items:
+            length = len(item.text)
+            bucket = next(
+                (limit for limit in self.bucket_limits if length <= limit),
+                self.bucket_limits[-1] + 1,
+            )
+            buckets.setdefault(bucket, []).append(item)
+        return buckets
+
+    async def _run_batch(self, items: List[_BatchItem]) -> None:
+        """Run one batched decode on the executor and resolve the futures."""
+        # Callers may have gone away (client disconnect) while queued
+        items = [item for item in items if not item.future.done()]
+        if not items:
+            return
+
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self.executor,
+                self.synthesize_fn,
+                [(item.text, item.voice, item.language) for item in items],
+            )
+        except Exception as e:
+            logger.error("batcher.batch_failed", error=str(e), batch_size=len(items))
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+
+        for item, pcm in zip(items, results):
+            if item.future.done():
+                continue
+            # Per-item failures (e.g. over-long text) come back as exceptions
+            if isinstance(pcm, Exception):
+                item.future.set_exception(pcm)
+            else:
+                item.future.set_result(pcm)
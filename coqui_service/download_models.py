@@ -8,6 +8,7 @@ Usage:
 """
 
 import os
+
 import modal
 
 # Create Modal app for model download
@@ -3,27 +3,121 @@
 Handles model loading from Modal Volume, synthesis, and voice cloning.
 """
 
+import contextlib
+import functools
+import hashlib
+import io
 import os
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 import numpy as np
 import structlog
 
+from coqui_service.utils.chunker import chunk_text
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba ships with coqui-tts; fall back to NumPy without it
+    njit = None
+
 logger = structlog.get_logger()
 
+# Fallback output sample rate if the model config doesn't say
+_DEFAULT_SAMPLE_RATE = 22050
+
+# Sample rate XTTS expects reference audio at (its load_audio default)
+_XTTS_REF_SR = 22050
+
+# Long inputs are split into chunks of at most this many characters (XTTS
+# quality drops past ~250) and decoded up to _MAX_DECODE_BATCH at a time
+_MAX_CHUNK_CHARS = 200
+_MAX_DECODE_BATCH = 8
+_JOIN_CROSSFADE_MS = 10
+
+# Flat safetensors copy of the XTTS weights (baked into the image by main.py)
+# and the Coqui checkpoint directory holding config.json / vocab.json
+_SAFETENSORS_FILE = "xtts_v2.safetensors"
+_XTTS_MODEL_DIR = "tts_models--multilingual--multi-dataset--xtts_v2"
+
+# RAM-backed scratch dir for reference audio (falls back to the default tmpdir)
+_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+class TextTooLongError(ValueError):
+    """Text encodes to more tokens than the XTTS GPT accepts."""
+
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _f32_to_pcm16(samples, out):
+        """Fused clip + scale + cast of float32 samples into int16 (truncating)."""
+        for i in prange(samples.shape[0]):
+            value = min(max(samples[i], np.float32(-1.0)), np.float32(1.0))
+            out[i] = np.int16(value * np.float32(32767.0))
+
+else:
+    _f32_to_pcm16 = None
+
+
+def _inference_mode(fn):
+    """Run the wrapped method under torch.inference_mode() (torch imported lazily)."""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        import torch
+
+        with torch.inference_mode():
+            return fn(*args, **kwargs)
+
+    return wrapper
+
 
 class TTSEngine:
     """Coqui XTTS v2 engine wrapper."""
 
-    def __init__(self, model_path: str = "/models/coqui"):
+    def __init__(self, model_path: str = "/models/coqui", cache_path: Optional[str] = None):
         self.model_path = Path(model_path)
-        self.tts = None
-        self.sample_rate = 22050  # XTTS v2 default
+        # Writable, persistent location for runtime caches (defaults to model_path)
+        self.cache_path = Path(cache_path) if cache_path else self.model_path
+        self.tts = None  # TTS API wrapper (only set on the pickle-checkpoint path)
+        self.model = None  # Xtts model
+        self.sample_rate = _DEFAULT_SAMPLE_RATE
         self._loaded = False
 
+        # Voice-clone conditioning latents, LRU keyed by reference audio digest
+        self._latent_cache: "OrderedDict[bytes, Tuple[Any, Any]]" = OrderedDict()
+        self._latent_cache_max = 64
+
+        # Built-in speaker latents, resolved once at load time
+        self._builtin_latents: Dict[str, Tuple[Any, Any]] = {}
+
+        # Built-in speaker names (ordered, set for O(1) checks, error preview)
+        self._speakers: Tuple[str, ...] = ()
+        self._speaker_set: frozenset = frozenset()
+        self._speaker_preview = ""
+
+        # Reduced-precision dtype of the decoder weights (None = FP32) and its
+        # name, reported by /health
+        self._half_dtype = None
+        self.dtype = "float32"
+
+        # Modules compiled in place by _compile_model, until warmup proves them
+        self._compiled_modules: List[Any] = []
+
+        # Side CUDA stream for host-to-device copies of reference audio
+        self._transfer_stream = None
+
+        # Memoized (text, language) -> token ids, bound in load_model
+        self._tokenizer = None
+        self._tokenize = None
+
     def load_model(self) -> None:
-        """Load XTTS v2 model from Modal Volume.
+        """Load XTTS v2 model from Modal Volume onto the GPU and warm it up.
+
+        Equivalent to ``load_weights()`` followed by ``activate()``.
 
         Raises:
             RuntimeError: If model loading fails
@@ -32,65 +126,316 @@ class TTSEngine:
             logger.info("tts_engine.already_loaded")
             return
 
-        try:
-            from TTS.api import TTS
+        self.load_weights(gpu=True)
+        self.activate()
 
-            # Set TTS_HOME to Volume path
-            os.environ["TTS_HOME"] = str(self.model_path)
+    def load_weights(self, gpu: bool = True) -> None:
+        """Load XTTS v2 weights from the model directory.
 
-            logger.info("tts_engine.loading", model_path=str(self.model_path))
+        With ``gpu=False`` nothing touches CUDA, so this can run inside a
+        Modal memory snapshot; call ``activate()`` afterwards.
+
+        Raises:
+            RuntimeError: If model loading fails
+        """
+        if self.model is not None:
+            return
 
-            # Load XTTS v2 model
-            self.tts = TTS(
-                model_name="tts_models/multilingual/multi-dataset/xtts_v2",
-                progress_bar=False,
-                gpu=True,  # Use GPU if available (Modal T4)
+        try:
+            # Point Coqui at the model directory (baked image path or Volume)
+            os.environ["TTS_HOME"] = str(self.model_path)
+
+            # Persist Inductor's compiled graphs on the Volume across cold starts
+            os.environ.setdefault("TORCHINDUCTOR_FX_GRAPH_CACHE", "1")
+            os.environ.setdefault(
+                "TORCHINDUCTOR_CACHE_DIR", str(self.cache_path / "inductor_cache")
             )
 
+            logger.info("tts_engine.loading", model_path=str(self.model_path), gpu=gpu)
+
+            safetensors_path = self.model_path / _SAFETENSORS_FILE
+            checkpoint_dir = next(self.model_path.glob(f"**/{_XTTS_MODEL_DIR}"), None)
+
+            if safetensors_path.exists() and checkpoint_dir is not None:
+                # Fast path: build the model skeleton and mmap the flat weights
+                self.model = self._load_from_safetensors(
+                    checkpoint_dir, safetensors_path, device="cuda" if gpu else "cpu"
+                )
+            else:
+                from TTS.api import TTS
+
+                # Load XTTS v2 model
+                self.tts = TTS(
+                    model_name="tts_models/multilingual/multi-dataset/xtts_v2",
+                    progress_bar=False,
+                    gpu=gpu,  # Use GPU if available (Modal T4)
+                )
+                self.model = self.tts.synthesizer.tts_model
+
             # Infer sample rate from model
             self.sample_rate = self._infer_sample_rate()
 
+            # Speaker names are fixed for the lifetime of the model
+            self._speakers = tuple(self._read_speakers())
+            self._speaker_set = frozenset(self._speakers)
+            self._speaker_preview = ", ".join(self._speakers[:5])
+
+            # Cache the BPE tokenizer and memoize normalization + encoding
+            self._tokenizer = self.model.tokenizer
+            self._tokenize = functools.lru_cache(maxsize=1024)(self._encode_text)
+
+            # Compile the PCM16 kernel now so the first request doesn't pay for it
+            self._to_pcm16(np.zeros(16, dtype=np.float32))
+
+        except Exception as e:
+            self.tts = None
+            self.model = None
+            logger.error("tts_engine.load_failed", error=str(e))
+            raise RuntimeError(f"Failed to load TTS model: {e}") from e
+
+    def activate(self, device: str = "cuda") -> None:
+        """Move loaded weights to the inference device and warm the hot paths.
+
+        Raises:
+            RuntimeError: If weights are not loaded or activation fails
+        """
+        if self._loaded:
+            return
+
+        if self.model is None:
+            raise RuntimeError("Model weights not loaded. Call load_weights() first.")
+
+        try:
+            import torch
+
+            # Inference-only process: no autograd bookkeeping on this thread
+            # (request threads are covered by the per-call inference_mode)
+            torch.set_grad_enabled(False)
+
+            if torch.cuda.is_available():
+                self.model.to(device)
+
+            # Built-in speaker latents never change; pin them on the device once
+            self._builtin_latents = self._load_builtin_latents()
+
+            # BF16/FP16 weights for the GPT decoder and vocoder
+            self._use_half_precision()
+
+            # Inductor-compile the per-token GPT step and the vocoder
+            self._compile_model()
+
             self._loaded = True
+
+            # Trigger compilation before the first real request
+            self._warmup()
             logger.info(
                 "tts_engine.loaded",
                 sample_rate=self.sample_rate,
-                has_speakers=hasattr(self.tts, "speakers"),
-                speaker_count=len(self.tts.speakers) if hasattr(self.tts, "speakers") else 0,
+                has_speakers=bool(self._speakers),
+                speaker_count=len(self._speakers),
             )
 
         except Exception as e:
+            self._loaded = False
             logger.error("tts_engine.load_failed", error=str(e))
             raise RuntimeError(f"Failed to load TTS model: {e}") from e
 
-    def _infer_sample_rate(self) -> int:
-        """Infer sample rate from loaded model."""
-        if not self.tts:
-            return 22050
-
-        # Try multiple paths to find sample rate
-        for path in [
-            ("synthesizer", "output_sample_rate"),
-            ("synthesizer", "sample_rate"),
-            ("tts_config", "audio", "sample_rate"),
-        ]:
-            current = self.tts
-            try:
-                for key in path:
-                    if isinstance(key, str) and hasattr(current, key):
-                        current = getattr(current, key)
-                    elif isinstance(current, dict) and key in current:
-                        current = current[key]
-                    else:
-                        current = None
-                        break
-
-                if isinstance(current, int):
-                    return current
-            except Exception:
+    def _use_half_precision(self) -> None:
+        """Convert the GPT decoder and HiFi-GAN waveform decoder to BF16/FP16.
+
+        BF16 on Ampere and newer (FP32 range, no overflow in the GPT logits),
+        FP16 on older cards such as the T4 that lack BF16 tensor cores.
+        LayerNorms and the HiFi-GAN speaker encoder stay in FP32; inference
+        runs under autocast so mixed-dtype ops are cast consistently.
+        """
+        import torch
+
+        if not torch.cuda.is_available():
+            return
+
+        major, _ = torch.cuda.get_device_capability()
+        half_dtype = torch.bfloat16 if major >= 8 else torch.float16
+
+        tts_model = self.model
+        tts_model.gpt.to(half_dtype)
+        tts_model.hifigan_decoder.waveform_decoder.to(half_dtype)
+
+        for module in tts_model.gpt.modules():
+            if isinstance(module, torch.nn.LayerNorm):
+                module.float()
+
+        self._half_dtype = half_dtype
+        self.dtype = str(half_dtype).replace("torch.", "")
+        logger.info("tts_engine.half_precision.enabled", dtype=self.dtype)
+
+    def _inference_context(self):
+        """Context for model calls: inference mode, plus BF16/FP16 autocast if enabled."""
+        import torch
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(torch.inference_mode())
+        if self._half_dtype is not None:
+            stack.enter_context(torch.autocast("cuda", dtype=self._half_dtype))
+        return stack
+
+    def _compile_model(self) -> None:
+        """Compile the GPT decoder step and HiFi-GAN vocoder with torch.compile.
+
+        Default Inductor mode (kernel fusion, no CUDA graphs): the KV cache
+        grows every step and the compiled modules are shared by interleaved
+        streams and batches, so graph replay would re-record per shape and
+        hand out buffers the next replay overwrites. Compilation is lazy;
+        _warmup runs the first forward and reverts to eager if it fails. Set
+        TORCH_COMPILE=0 to skip compilation entirely (rollback switch).
+        """
+        if os.environ.get("TORCH_COMPILE", "1") == "0":
+            logger.info("tts_engine.compile_skipped", reason="TORCH_COMPILE=0")
+            return
+
+        tts_model = self.model
+        for name, module in (
+            ("gpt_inference", getattr(tts_model.gpt, "gpt_inference", None)),
+            ("hifigan_decoder", getattr(tts_model, "hifigan_decoder", None)),
+        ):
+            if module is None:
                 continue
+            try:
+                module.compile(dynamic=True, fullgraph=False)
+                self._compiled_modules.append(module)
+                logger.info("tts_engine.compiled", module=name)
+            except Exception as e:
+                logger.warning("tts_engine.compile_failed", module=name, error=str(e))
+
+    def _revert_compiled(self) -> None:
+        """Drop in-place compilation so the modules run eager again."""
+        for module in self._compiled_modules:
+            # What nn.Module.compile() sets; None restores the eager __call__
+            module._compiled_call_impl = None
+        self._compiled_modules = []
+
+    def _warmup(self) -> None:
+        """Run one short synthesis so compiled graphs are ready before traffic.
+
+        This is the first forward through the compiled modules, so Inductor
+        errors surface here; on failure they are reverted to eager and the
+        synthesis retried, rather than failing every user request.
+        """
+        if not self._builtin_latents:
+            # Nothing to prove compilation with; don't ship it untested
+            self._revert_compiled()
+            return
+
+        speaker_id = next(iter(self._builtin_latents))
+        try:
+            self.synthesize_builtin("Warming up the speech model.", speaker_id)
+            logger.info("tts_engine.warmup.complete", speaker=speaker_id)
+            return
+        except Exception as e:
+            if not self._compiled_modules:
+                logger.warning("tts_engine.warmup.failed", error=str(e))
+                return
+            logger.warning("tts_engine.compile_failed", module="warmup", error=str(e))
+
+        self._revert_compiled()
+        try:
+            self.synthesize_builtin("Warming up the speech model.", speaker_id)
+            logger.info("tts_engine.warmup.complete", speaker=speaker_id, compiled=False)
+        except Exception as e:
+            logger.warning("tts_engine.warmup.failed", error=str(e))
+
+    def _infer_sample_rate(self) -> int:
+        """Read the output sample rate from the loaded model (once, at load)."""
+        if not self.model:
+            return _DEFAULT_SAMPLE_RATE
+
+        audio_config = self.model.config.audio
+        try:
+            return int(audio_config.output_sample_rate)
+        except (AttributeError, TypeError):
+            pass
+        try:
+            return int(audio_config.sample_rate)
+        except (AttributeError, TypeError):
+            return _DEFAULT_SAMPLE_RATE
+
+    def _load_from_safetensors(self, checkpoint_dir: Path, weights_path: Path, device: str):
+        """Build an Xtts skeleton from config/vocab and load flat safetensors weights.
+
+        Mirrors ``Xtts.load_checkpoint`` but reads the single mmap-able file
+        written by download_models.py instead of the pickled model.pth.
+        """
+        from safetensors.torch import load_model
+        from TTS.tts.configs.xtts_config import XttsConfig
+        from TTS.tts.layers.xtts.tokenizer import VoiceBpeTokenizer
+        from TTS.tts.layers.xtts.xtts_manager import LanguageManager, SpeakerManager
+        from TTS.tts.models.xtts import Xtts
+
+        config = XttsConfig()
+        config.load_json(str(checkpoint_dir / "config.json"))
 
-        return 22050  # Default fallback
+        model = Xtts.init_from_config(config)
+        model.language_manager = LanguageManager(config)
+        speaker_file = checkpoint_dir / "speakers_xtts.pth"
+        model.speaker_manager = SpeakerManager(str(speaker_file)) if speaker_file.exists() else None
+        model.tokenizer = VoiceBpeTokenizer(vocab_file=str(checkpoint_dir / "vocab.json"))
+        model.init_models()
 
+        # The saved state dict includes the inference wrapper's (shared) weights
+        model.gpt.init_gpt_for_inference(kv_cache=model.args.kv_cache, use_deepspeed=False)
+        load_model(model, str(weights_path), device=device)
+
+        model.hifigan_decoder.eval()
+        model.gpt.eval()
+        model.eval()
+
+        logger.info("tts_engine.safetensors_loaded", path=str(weights_path))
+        return model
+
+    def _encode_text(self, text: str, language: str) -> Tuple[int, ...]:
+        """Normalize and BPE-encode text the way Xtts.inference does."""
+        lang = language.split("-")[0]  # tokenizer uses bare language codes
+        return tuple(self._tokenizer.encode(text.strip().lower(), lang=lang))
+
+    def _check_text_tokens(self, text: str, language: str) -> None:
+        """Raise TextTooLongError if text encodes to more tokens than the GPT accepts."""
+        limit = self.model.args.gpt_max_text_tokens
+        token_count = len(self._tokenize(text, language))
+        if token_count >= limit:
+            raise TextTooLongError(
+                f"Text chunk is {token_count} tokens; XTTS accepts fewer than {limit}"
+            )
+
+    def _load_builtin_latents(self) -> Dict[str, Tuple[Any, Any]]:
+        """Collect (gpt_cond_latent, speaker_embedding) for every built-in speaker."""
+        tts_model = self.model
+        speaker_manager = getattr(tts_model, "speaker_manager", None)
+        if speaker_manager is None or not getattr(speaker_manager, "speakers", None):
+            return {}
+
+        device = tts_model.device
+        latents = {}
+        for name, entry in speaker_manager.speakers.items():
+            latents[name] = (
+                entry["gpt_cond_latent"].to(device),
+                entry["speaker_embedding"].to(device),
+            )
+
+        logger.info("tts_engine.builtin_latents.loaded", speaker_count=len(latents))
+        return latents
+
+    def get_builtin_latents(self, speaker_id: str) -> Tuple[Any, Any]:
+        """Look up the cached latents for a built-in speaker.
+
+        Raises:
+            ValueError: If speaker_id is invalid
+        """
+        if speaker_id not in self._speaker_set or speaker_id not in self._builtin_latents:
+            raise ValueError(
+                f"Invalid speaker: {speaker_id}. Valid speakers: {self._speaker_preview}..."
+            )
+        return self._builtin_latents[speaker_id]
+
+    @_inference_mode
     def synthesize_builtin(
         self,
         text: str,
@@ -110,18 +455,12 @@ class TTSEngine:
         Raises:
             RuntimeError: If synthesis fails
             ValueError: If speaker_id is invalid
+            TextTooLongError: If text encodes to too many tokens
         """
         if not self._loaded:
             raise RuntimeError("Model not loaded. Call load_model() first.")
 
-        # Validate speaker
-        if hasattr(self.tts, "speakers") and self.tts.speakers:
-            speakers = self.tts.speakers
-            valid_speakers = speakers if isinstance(speakers, list) else list(speakers.keys())
-            if speaker_id not in valid_speakers:
-                raise ValueError(
-                    f"Invalid speaker: {speaker_id}. Valid speakers: {', '.join(valid_speakers[:5])}..."
-                )
+        latents = self.get_builtin_latents(speaker_id)
 
         try:
             logger.info(
@@ -131,16 +470,9 @@ class TTSEngine:
                 text_len=len(text),
             )
 
-            # Synthesize with built-in speaker
-            audio = self.tts.tts(
-                text=text,
-                speaker=speaker_id,
-                language=language,
-                split_sentences=False,  # We handle chunking externally
-            )
-
-            # Convert to PCM16 bytes
-            pcm_bytes = self._to_pcm16(audio)
+            # Synthesize with the pre-resolved built-in speaker latents
+            gpt_cond_latent, speaker_embedding = latents
+            pcm_bytes = self._synthesize_text(text, language, gpt_cond_latent, speaker_embedding)
 
             logger.info(
                 "tts_engine.synthesize.complete",
@@ -149,10 +481,227 @@ class TTSEngine:
 
             return pcm_bytes
 
+        except TextTooLongError:
+            raise
+
         except Exception as e:
             logger.error("tts_engine.synthesize.failed", error=str(e), speaker=speaker_id)
             raise RuntimeError(f"Synthesis failed: {e}") from e
 
+    @_inference_mode
+    def synthesize_batch(
+        self, items: List[Tuple[str, str, str]]
+    ) -> List[Union[bytes, ValueError]]:
+        """Synthesize several built-in speaker requests in one GPT decode.
+
+        Prompts are left-padded to a common prefix length and masked, so the
+        autoregressive decode runs once for the whole batch; the GPT latent
+        pass and vocoder then run per row on the trimmed codes.
+
+        Args:
+            items: (text, speaker_id, language) tuples
+
+        Returns:
+            Raw PCM16 bytes per item, in order; an item with an invalid
+            speaker_id or over-long text gets its ValueError instead, so it
+            fails alone rather than taking the batch down
+
+        Raises:
+            RuntimeError: If synthesis fails
+        """
+        if not self._loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        if len(items) == 1:
+            text, speaker_id, language = items[0]
+            return [self.synthesize_builtin(text, speaker_id, language)]
+
+        results: List[Union[bytes, ValueError]] = [b""] * len(items)
+        rows = []
+        positions = []
+        for i, (text, speaker_id, language) in enumerate(items):
+            try:
+                self._check_text_tokens(text, language)
+                gpt_cond_latent, speaker_embedding = self.get_builtin_latents(speaker_id)
+            except ValueError as e:
+                results[i] = e
+                continue
+            rows.append((text, language, gpt_cond_latent, speaker_embedding))
+            positions.append(i)
+
+        if not rows:
+            return results
+
+        try:
+            logger.info("tts_engine.batch.start", batch_size=len(rows))
+            with self._inference_context():
+                wavs = self._decode_batch(rows)
+            pcm_list = [self._to_pcm16(wav) for wav in wavs]
+            logger.info("tts_engine.batch.complete", batch_size=len(rows))
+
+        except Exception as e:
+            # Batched decode is an optimization; never fail a request over it
+            logger.warning("tts_engine.batch.fallback", error=str(e), batch_size=len(rows))
+            pcm_list = [
+                self.synthesize_builtin(*items[i])
+                for i in positions
+            ]
+
+        for i, pcm in zip(positions, pcm_list):
+            results[i] = pcm
+        return results
+
+    @_inference_mode
+    def synthesize_clone_requests(
+        self, items: List[Tuple[str, Tuple[Any, Any], str]]
+    ) -> List[Union[bytes, ValueError]]:
+        """Synthesize voice-clone chunks from several requests in one GPT decode.
+
+        Each item carries the conditioning latents its request already
+        resolved through compute_conditioning, so the synth thread neither
+        rehashes the reference audio nor reruns the encoders here.
+
+        Args:
+            items: (text, (gpt_cond_latent, speaker_embedding), language) tuples
+
+        Returns:
+            Raw PCM16 bytes per item, in order; an item with missing latents
+            or over-long text gets its ValueError instead, so it fails alone
+            rather than taking the batch down
+
+        Raises:
+            RuntimeError: If synthesis fails
+        """
+        if not self._loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        results: List[Union[bytes, ValueError]] = [b""] * len(items)
+        rows = []
+        positions = []
+        for i, (text, latents, language) in enumerate(items):
+            try:
+                if not latents:
+                    raise ValueError("Conditioning latents are required for voice cloning")
+                self._check_text_tokens(text, language)
+            except ValueError as e:
+                results[i] = e
+                continue
+            rows.append((text, language, *latents))
+            positions.append(i)
+
+        if not rows:
+            return results
+
+        try:
+            logger.info(
+                "tts_engine.clone_requests.start",
+                batch_size=len(rows),
+                # Chunks of one request share the same latents tuple
+                reference_sets=len({id(items[i][1]) for i in positions}),
+            )
+            with self._inference_context():
+                wavs = self._decode_batch(rows)
+            pcm_list = [self._to_pcm16(wav) for wav in wavs]
+            logger.info("tts_engine.clone_requests.complete", batch_size=len(rows))
+
+        except Exception as e:
+            # Batched decode is an optimization; never fail a request over it
+            logger.warning("tts_engine.clone_requests.fallback", error=str(e), batch_size=len(rows))
+            pcm_list = [
+                self._synthesize_text(text, language, gpt_cond_latent, speaker_embedding)
+                for text, language, gpt_cond_latent, speaker_embedding in rows
+            ]
+
+        for i, pcm in zip(positions, pcm_list):
+            results[i] = pcm
+        return results
+
+    def _decode_batch(self, rows: List[Tuple[str, str, Any, Any]]) -> List[Any]:
+        """Batched XTTS GPT generate followed by per-row latents + vocoder.
+
+        Also the single-request path: feeding memoized token ids here skips
+        the text normalization/tokenization that tts_model.inference repeats.
+        """
+        import torch
+        import torch.nn.functional as nnf
+
+        tts_model = self.model
+        gpt = tts_model.gpt
+        device = tts_model.device
+        kwargs = self._inference_kwargs()
+
+        # Xtts.inference asserts this; past it the text position embedding
+        # overflows with an opaque CUDA index error
+        for text, language, _, _ in rows:
+            self._check_text_tokens(text, language)
+
+        with torch.inference_mode():
+            # Per-row prefix embedding: [cond latents | start, text, stop]
+            text_tokens = []
+            prefixes = []
+            for text, language, gpt_cond_latent, _ in rows:
+                tokens = torch.IntTensor(self._tokenize(text, language)).unsqueeze(0).to(device)
+                text_tokens.append(tokens)
+
+                padded = nnf.pad(tokens, (0, 1), value=gpt.stop_text_token)
+                padded = nnf.pad(padded, (1, 0), value=gpt.start_text_token)
+                emb = gpt.text_embedding(padded) + gpt.text_pos_embedding(padded)
+                prefixes.append(torch.cat([gpt_cond_latent.to(device, emb.dtype), emb], dim=1))
+
+            # Left-pad prefixes to a common length and mask the padding out
+            batch_size = len(prefixes)
+            prefix_len = max(p.shape[1] for p in prefixes)
+            prefix_emb = prefixes[0].new_zeros(batch_size, prefix_len, prefixes[0].shape[-1])
+            attention_mask = torch.zeros(batch_size, prefix_len + 1, dtype=torch.long, device=device)
+            for i, prefix in enumerate(prefixes):
+                prefix_emb[i, prefix_len - prefix.shape[1]:] = prefix[0]
+                attention_mask[i, prefix_len - prefix.shape[1]:] = 1
+
+            gpt.gpt_inference.store_prefix_emb(prefix_emb)
+            gpt_inputs = torch.full(
+                (batch_size, prefix_len + 1), fill_value=1, dtype=torch.long, device=device
+            )
+            gpt_inputs[:, -1] = gpt.start_audio_token
+
+            generated = gpt.gpt_inference.generate(
+                gpt_inputs,
+                attention_mask=attention_mask,
+                bos_token_id=gpt.start_audio_token,
+                pad_token_id=gpt.stop_audio_token,
+                eos_token_id=gpt.stop_audio_token,
+                max_length=gpt.max_gen_mel_tokens + gpt_inputs.shape[-1],
+                do_sample=True,
+                num_return_sequences=1,
+                num_beams=1,
+                output_attentions=False,
+                **kwargs,
+            )
+            codes = generated[:, gpt_inputs.shape[1]:]
+
+            wavs = []
+            for i, (_, _, gpt_cond_latent, speaker_embedding) in enumerate(rows):
+                # Trim each row after its own stop token (rows finish at different steps)
+                row_codes = codes[i:i + 1]
+                stops = (row_codes[0] == gpt.stop_audio_token).nonzero()
+                if len(stops) > 0:
+                    row_codes = row_codes[:, : int(stops[0]) + 1]
+
+                tokens = text_tokens[i]
+                gpt_latents = gpt(
+                    tokens,
+                    torch.tensor([tokens.shape[-1]], device=device),
+                    row_codes,
+                    torch.tensor([row_codes.shape[-1] * gpt.code_stride_len], device=device),
+                    cond_latents=gpt_cond_latent.to(device),
+                    return_attentions=False,
+                    return_latent=True,
+                )
+                wav = tts_model.hifigan_decoder(gpt_latents, g=speaker_embedding.to(device))
+                wavs.append(wav)
+
+        return wavs
+
+    @_inference_mode
     def synthesize_clone(
         self,
         text: str,
@@ -173,6 +722,7 @@ class TTSEngine:
         Raises:
             RuntimeError: If synthesis fails
             ValueError: If reference_audio_bytes is empty
+            TextTooLongError: If text encodes to too many tokens
         """
         if not self._loaded:
             raise RuntimeError("Model not loaded. Call load_model() first.")
@@ -180,15 +730,7 @@ class TTSEngine:
         if not reference_audio_bytes:
             raise ValueError("At least one reference audio file is required")
 
-        # Write reference audio to temp files
-        temp_files = []
         try:
-            # Create temp file for each reference audio
-            for idx, audio_bytes in enumerate(reference_audio_bytes):
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as f:
-                    f.write(audio_bytes)
-                    temp_files.append(f.name)
-
             logger.info(
                 "tts_engine.clone.start",
                 language=language,
@@ -197,32 +739,335 @@ class TTSEngine:
                 ref_audio_sizes=[len(b) for b in reference_audio_bytes],
             )
 
-            # Synthesize with voice cloning
-            # If single file, pass string; if multiple, pass list
-            speaker_wav = temp_files[0] if len(temp_files) == 1 else temp_files
-
-            audio = self.tts.tts(
-                text=text,
-                speaker_wav=speaker_wav,
-                language=language,
-                split_sentences=False,
-            )
+            # Conditioning latents are cached per reference set, so repeat
+            # clones (and every chunk after the first) skip the encoder pass
+            gpt_cond_latent, speaker_embedding = self._get_clone_latents(reference_audio_bytes)
 
-            # Convert to PCM16 bytes
-            pcm_bytes = self._to_pcm16(audio)
+            pcm_bytes = self._synthesize_text(text, language, gpt_cond_latent, speaker_embedding)
 
             logger.info(
                 "tts_engine.clone.complete",
                 audio_size=len(pcm_bytes),
-                ref_audio_count=len(temp_files),
+                ref_audio_count=len(reference_audio_bytes),
             )
 
             return pcm_bytes
 
+        except TextTooLongError:
+            raise
+
         except Exception as e:
             logger.error("tts_engine.clone.failed", error=str(e))
             raise RuntimeError(f"Voice cloning failed: {e}") from e
 
+    @_inference_mode
+    def synthesize_clone_batch(
+        self,
+        texts: List[str],
+        reference_audio_bytes: List[bytes],
+        language: str = "en",
+    ) -> List[bytes]:
+        """Synthesize several text chunks in one cloned voice, batched.
+
+        Args:
+            texts: Text chunks to synthesize
+            reference_audio_bytes: List of reference audio file bytes
+            language: Language code
+
+        Returns:
+            Raw PCM16 bytes per chunk, in order
+
+        Raises:
+            RuntimeError: If synthesis fails
+            ValueError: If reference_audio_bytes is empty
+            TextTooLongError: If text encodes to too many tokens
+        """
+        if not self._loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        if not reference_audio_bytes:
+            raise ValueError("At least one reference audio file is required")
+
+        try:
+            logger.info(
+                "tts_engine.clone_batch.start",
+                language=language,
+                chunk_count=len(texts),
+                ref_audio_count=len(reference_audio_bytes),
+            )
+
+            gpt_cond_latent, speaker_embedding = self._get_clone_latents(reference_audio_bytes)
+            pcm_list = self._decode_texts(texts, language, gpt_cond_latent, speaker_embedding)
+
+            logger.info("tts_engine.clone_batch.complete", chunk_count=len(pcm_list))
+            return pcm_list
+
+        except TextTooLongError:
+            raise
+
+        except Exception as e:
+            logger.error("tts_engine.clone_batch.failed", error=str(e))
+            raise RuntimeError(f"Voice cloning failed: {e}") from e
+
+    def _synthesize_text(self, text: str, language: str, gpt_cond_latent, speaker_embedding) -> bytes:
+        """Synthesize text of any length for one speaker.
+
+        Text over _MAX_CHUNK_CHARS is split at sentence boundaries, the chunks
+        are decoded in batches, and the audio is joined with a short crossfade.
+        """
+        if len(text) <= _MAX_CHUNK_CHARS:
+            return self._decode_texts([text], language, gpt_cond_latent, speaker_embedding)[0]
+
+        chunks = chunk_text(text, max_chars=_MAX_CHUNK_CHARS) or [text]
+        logger.info("tts_engine.long_text.split", chunk_count=len(chunks), text_len=len(text))
+
+        pcm_chunks = self._decode_texts(chunks, language, gpt_cond_latent, speaker_embedding)
+        return self._crossfade_join(pcm_chunks)
+
+    def _decode_texts(
+        self, texts: List[str], language: str, gpt_cond_latent, speaker_embedding
+    ) -> List[bytes]:
+        """Decode texts for one speaker in GPT batches of up to _MAX_DECODE_BATCH."""
+        pcm_list = []
+        for start in range(0, len(texts), _MAX_DECODE_BATCH):
+            rows = [
+                (text, language, gpt_cond_latent, speaker_embedding)
+                for text in texts[start:start + _MAX_DECODE_BATCH]
+            ]
+            with self._inference_context():
+                wavs = self._decode_batch(rows)
+            pcm_list.extend(self._to_pcm16(wav) for wav in wavs)
+        return pcm_list
+
+    def _crossfade_join(self, pcm_chunks: List[bytes]) -> bytes:
+        """Concatenate PCM16 chunks with a _JOIN_CROSSFADE_MS linear crossfade."""
+        if len(pcm_chunks) == 1:
+            return pcm_chunks[0]
+
+        fade_samples = int(self.sample_rate * _JOIN_CROSSFADE_MS / 1000)
+        pieces = []
+        tail = np.frombuffer(pcm_chunks[0], dtype=np.int16).astype(np.float32)
+        for chunk in pcm_chunks[1:]:
+            head = np.frombuffer(chunk, dtype=np.int16).astype(np.float32)
+            n = min(fade_samples, len(tail), len(head))
+            ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+            pieces.append(tail[: len(tail) - n])
+            pieces.append(tail[len(tail) - n:] * (1.0 - ramp) + head[:n] * ramp)
+            tail = head[n:]
+        pieces.append(tail)
+
+        return np.rint(np.concatenate(pieces)).astype(np.int16).tobytes()
+
+    @staticmethod
+    def reference_key(reference_audio_bytes: List[bytes]) -> bytes:
+        """BLAKE2b digest identifying a reference set in the latent cache."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for audio_bytes in reference_audio_bytes:
+            hasher.update(len(audio_bytes).to_bytes(8, "little"))
+            hasher.update(audio_bytes)
+        return hasher.digest()
+
+    def has_conditioning(self, key: bytes) -> bool:
+        """Whether latents for a reference_key are already cached."""
+        return key in self._latent_cache
+
+    def prepare_references(self, reference_audio_bytes: List[bytes]) -> Optional[List[Any]]:
+        """Decode, resample and trim reference audio on the calling (CPU) thread.
+
+        Returns pinned host tensors ready for a single non-blocking copy to
+        the GPU, or None if the in-memory decoder can't read a file (the
+        engine then falls back to Coqui's file-based loader). Touches no
+        model state, so it is safe to run off the synth thread.
+        """
+        import torch
+
+        max_samples = _XTTS_REF_SR * self.model.config.max_ref_len
+        try:
+            audios = [
+                self._decode_reference(audio_bytes)[:, :max_samples].contiguous()
+                for audio_bytes in reference_audio_bytes
+            ]
+        except Exception as e:
+            logger.warning("tts_engine.reference_decode_fallback", error=str(e))
+            return None
+
+        if torch.cuda.is_available():
+            audios = [audio.pin_memory() for audio in audios]
+        return audios
+
+    def compute_conditioning(
+        self,
+        reference_audio_bytes: List[bytes],
+        prepared: Optional[List[Any]] = None,
+        key: Optional[bytes] = None,
+    ) -> Tuple[Tuple[Any, Any], bool]:
+        """Return the conditioning latents for a reference set, and whether they were cached.
+
+        Latents are kept in an LRU keyed by a BLAKE2b digest of the reference
+        audio, so identical uploads (and every chunk of one request) reuse the
+        tensors already on the GPU instead of re-running the encoders.
+
+        Args:
+            reference_audio_bytes: Reference audio files
+            prepared: Output of prepare_references, if already computed
+            key: Output of reference_key, if already computed
+
+        Raises:
+            RuntimeError: If model not loaded
+            ValueError: If reference_audio_bytes is empty
+        """
+        if not self._loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        if not reference_audio_bytes:
+            raise ValueError("At least one reference audio file is required")
+
+        if key is None:
+            key = self.reference_key(reference_audio_bytes)
+
+        cached = self._latent_cache.get(key)
+        if cached is not None:
+            self._latent_cache.move_to_end(key)
+            logger.debug("tts_engine.latents.cache_hit", cache_size=len(self._latent_cache))
+            return cached, True
+
+        latents = self._compute_clone_latents(reference_audio_bytes, prepared)
+
+        self._latent_cache[key] = latents
+        if len(self._latent_cache) > self._latent_cache_max:
+            self._latent_cache.popitem(last=False)
+
+        logger.debug("tts_engine.latents.cache_miss", cache_size=len(self._latent_cache))
+        return latents, False
+
+    def _get_clone_latents(self, reference_audio_bytes: List[bytes]) -> Tuple[Any, Any]:
+        """Return (gpt_cond_latent, speaker_embedding) for a reference set."""
+        return self.compute_conditioning(reference_audio_bytes)[0]
+
+    def _compute_clone_latents(
+        self, reference_audio_bytes: List[bytes], prepared: Optional[List[Any]] = None
+    ) -> Tuple[Any, Any]:
+        """Run the XTTS conditioning encoder over the reference audio.
+
+        References are decoded in memory (here, unless the caller already
+        ran prepare_references on the CPU pool); if that fails (e.g. a
+        container format the in-process decoder can't read) fall back to
+        Coqui's file-based loader.
+        """
+        audios = prepared or self.prepare_references(reference_audio_bytes)
+        if audios is None:
+            return self._compute_clone_latents_from_files(reference_audio_bytes)
+
+        with self._inference_context():
+            return self._conditioning_from_audio(audios)
+
+    def _decode_reference(self, audio_bytes: bytes):
+        """Decode reference audio bytes to a mono, clipped (1, T) tensor at 22.05kHz.
+
+        Mirrors XTTS ``load_audio`` without a temp file or subprocess.
+        """
+        import torch
+        import torchaudio
+
+        audio, sr = torchaudio.load(io.BytesIO(audio_bytes))
+        if audio.size(0) != 1:
+            audio = torch.mean(audio, dim=0, keepdim=True)
+        if sr != _XTTS_REF_SR:
+            audio = torchaudio.functional.resample(audio, sr, _XTTS_REF_SR)
+        audio.clip_(-1, 1)
+        return audio
+
+    def _conditioning_from_audio(self, audios: List[Any]) -> Tuple[Any, Any]:
+        """XTTS ``get_conditioning_latents`` over pre-decoded reference tensors."""
+        import torch
+
+        tts_model = self.model
+        config = tts_model.config
+        device = tts_model.device
+
+        with torch.inference_mode():
+            # Trim on the host, then copy everything to the GPU in one go
+            audios = self._to_device_async(
+                [audio[:, : _XTTS_REF_SR * config.max_ref_len] for audio in audios],
+                device,
+            )
+
+            speaker_embeddings = []
+            trimmed = []
+            for audio in audios:
+                if config.sound_norm_refs:
+                    audio = (audio / torch.abs(audio).max()) * 0.75
+                speaker_embeddings.append(
+                    tts_model.get_speaker_embedding(audio, _XTTS_REF_SR)
+                )
+                trimmed.append(audio)
+
+            gpt_cond_latent = tts_model.get_gpt_cond_latents(
+                torch.cat(trimmed, dim=-1),
+                _XTTS_REF_SR,
+                length=config.gpt_cond_len,
+                chunk_length=config.gpt_cond_chunk_len,
+            )
+            speaker_embedding = torch.stack(speaker_embeddings).mean(dim=0)
+
+        return gpt_cond_latent, speaker_embedding
+
+    def _to_device_async(self, tensors: List[Any], device) -> List[Any]:
+        """Copy host tensors to the device through pinned memory on a side stream.
+
+        The copies are non-blocking and the compute stream waits on the
+        transfer stream, so decode work already queued keeps running.
+        """
+        import torch
+
+        if device.type != "cuda":
+            return [tensor.to(device) for tensor in tensors]
+
+        if self._transfer_stream is None:
+            self._transfer_stream = torch.cuda.Stream(device=device)
+
+        compute_stream = torch.cuda.current_stream(device)
+        with torch.cuda.stream(self._transfer_stream):
+            on_device = [
+                tensor.contiguous().pin_memory().to(device, non_blocking=True)
+                for tensor in tensors
+            ]
+        compute_stream.wait_stream(self._transfer_stream)
+
+        # Tensors were allocated on the side stream but are consumed on the
+        # compute stream; tell the caching allocator so memory isn't reused early
+        for tensor in on_device:
+            tensor.record_stream(compute_stream)
+
+        return on_device
+
+    def _compute_clone_latents_from_files(self, reference_audio_bytes: List[bytes]) -> Tuple[Any, Any]:
+        """Conditioning latents via Coqui's path-based loader (temp files)."""
+        tts_model = self.model
+        config = tts_model.config
+
+        # Write reference audio to temp files (tmpfs when available)
+        temp_files = []
+        try:
+            for audio_bytes in reference_audio_bytes:
+                with tempfile.NamedTemporaryFile(
+                    delete=False, suffix=".wav", dir=_SCRATCH_DIR
+                ) as f:
+                    f.write(audio_bytes)
+                    temp_files.append(f.name)
+
+            # If single file, pass string; if multiple, pass list
+            audio_path = temp_files[0] if len(temp_files) == 1 else temp_files
+
+            with self._inference_context():
+                return tts_model.get_conditioning_latents(
+                    audio_path=audio_path,
+                    max_ref_length=config.max_ref_len,
+                    gpt_cond_len=config.gpt_cond_len,
+                    gpt_cond_chunk_len=config.gpt_cond_chunk_len,
+                    sound_norm_refs=config.sound_norm_refs,
+                )
+
         finally:
             # Clean up all temp files
             for temp_file in temp_files:
@@ -232,6 +1077,103 @@ class TTSEngine:
                     except OSError:
                         logger.warning("tts_engine.cleanup_failed", path=temp_file)
 
+    def _inference_kwargs(self) -> Dict[str, Any]:
+        """Sampling settings from the model config (same as the tts.tts path)."""
+        config = self.model.config
+        return {
+            "temperature": config.temperature,
+            "length_penalty": config.length_penalty,
+            "repetition_penalty": config.repetition_penalty,
+            "top_k": config.top_k,
+            "top_p": config.top_p,
+        }
+
+    def synthesize_builtin_stream(
+        self,
+        text: str,
+        speaker_id: str,
+        language: str = "en",
+        stream_chunk_size: int = 20,
+    ) -> Iterator[bytes]:
+        """Stream speech for a built-in speaker as PCM16 chunks.
+
+        Audio is yielded as GPT tokens are decoded, so the first chunk arrives
+        long before the full utterance is generated.
+
+        Raises:
+            RuntimeError: If model not loaded
+            ValueError: If speaker_id is invalid
+        """
+        if not self._loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        gpt_cond_latent, speaker_embedding = self.get_builtin_latents(speaker_id)
+        yield from self._stream(
+            text, language, gpt_cond_latent, speaker_embedding, stream_chunk_size
+        )
+
+    def synthesize_clone_stream(
+        self,
+        text: str,
+        reference_audio_bytes: List[bytes],
+        language: str = "en",
+        stream_chunk_size: int = 20,
+    ) -> Iterator[bytes]:
+        """Stream voice-cloned speech as PCM16 chunks.
+
+        Raises:
+            RuntimeError: If model not loaded
+            ValueError: If reference_audio_bytes is empty
+        """
+        if not self._loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        if not reference_audio_bytes:
+            raise ValueError("At least one reference audio file is required")
+
+        gpt_cond_latent, speaker_embedding = self._get_clone_latents(reference_audio_bytes)
+        yield from self._stream(
+            text, language, gpt_cond_latent, speaker_embedding, stream_chunk_size
+        )
+
+    def _stream(
+        self,
+        text: str,
+        language: str,
+        gpt_cond_latent,
+        speaker_embedding,
+        stream_chunk_size: int,
+    ) -> Iterator[bytes]:
+        """Run XTTS inference_stream and convert each chunk to PCM16 bytes."""
+        logger.info(
+            "tts_engine.stream.start",
+            language=language,
+            text_len=len(text),
+            stream_chunk_size=stream_chunk_size,
+        )
+
+        stream = self.model.inference_stream(
+            text,
+            language,
+            gpt_cond_latent,
+            speaker_embedding,
+            stream_chunk_size=stream_chunk_size,
+            **self._inference_kwargs(),
+        )
+
+        # Grad/autocast state is thread-local and the consumer may resume us on
+        # a different worker thread, so enter it around each step only
+        chunk_count = 0
+        while True:
+            with self._inference_context():
+                chunk = next(stream, None)
+            if chunk is None:
+                break
+            chunk_count += 1
+            yield self._to_pcm16(chunk)
+
+        logger.info("tts_engine.stream.complete", chunk_count=chunk_count)
+
     def get_speakers(self) -> List[str]:
         """Get list of available built-in speakers.
 
@@ -244,17 +1186,20 @@ class TTSEngine:
         if not self._loaded:
             raise RuntimeError("Model not loaded. Call load_model() first.")
 
-        if not hasattr(self.tts, "speakers") or not self.tts.speakers:
-            return []
+        return list(self._speakers)
 
-        speakers = self.tts.speakers
+    @property
+    def speakers(self) -> List[str]:
+        """Built-in speaker names (same attribute the TTS API wrapper exposes)."""
+        return list(self._speakers)
 
-        if isinstance(speakers, list):
-            return speakers
-        elif isinstance(speakers, dict):
-            return list(speakers.keys())
+    def _read_speakers(self) -> List[str]:
+        """Read built-in speaker names from the loaded model."""
+        speaker_manager = getattr(self.model, "speaker_manager", None)
+        if speaker_manager is None or not getattr(speaker_manager, "speakers", None):
+            return []
 
-        return []
+        return list(speaker_manager.speakers.keys())
 
     def _to_pcm16(self, audio) -> bytes:
         """Convert audio array to PCM16 bytes.
@@ -265,21 +1210,38 @@ class TTSEngine:
         Returns:
             PCM16 bytes
         """
-        # Handle torch tensor
+        # Torch tensor: clip/scale/cast on its own device (GPU) so only int16
+        # crosses PCIe - half the bytes of the float32 waveform. All paths
+        # truncate toward zero like the original astype(np.int16) did.
         if hasattr(audio, "detach"):
-            audio = audio.detach().cpu().numpy()
+            import torch
+
+            pcm = (
+                audio.detach()
+                .float()
+                .reshape(-1)
+                .clamp(-1.0, 1.0)  # out-of-place: never mutate the caller's tensor
+                .mul_(32767.0)
+                .to(torch.int16)
+            )
+            return pcm.cpu().numpy().tobytes()
 
-        # Convert to numpy array
-        audio_array = np.asarray(audio)
+        # Single fused pass when the Numba kernel is available
+        if _f32_to_pcm16 is not None:
+            audio_array = np.ascontiguousarray(audio, dtype=np.float32).reshape(-1)
+            pcm = np.empty(audio_array.shape[0], dtype=np.int16)
+            _f32_to_pcm16(audio_array, pcm)
+            return pcm.tobytes()
 
-        # Flatten if multi-dimensional
-        if audio_array.ndim > 1:
-            audio_array = audio_array.reshape(-1)
+        # Private contiguous float32 scratch buffer (flattened), so the
+        # clip/scale below can run in place without temporaries
+        audio_array = np.array(audio, dtype=np.float32).reshape(-1)
 
-        # Clip to [-1.0, 1.0] range
-        audio_array = np.clip(audio_array, -1.0, 1.0)
+        # Clip to [-1.0, 1.0] and scale in place
+        np.clip(audio_array, -1.0, 1.0, out=audio_array)
+        np.multiply(audio_array, 32767.0, out=audio_array)
 
         # Convert to 16-bit PCM
-        pcm = (audio_array * 32767).astype(np.int16)
+        pcm = audio_array.astype(np.int16)
 
         return pcm.tobytes()
@@ -6,12 +6,17 @@ This module defines the Modal application with ASGI/FastAPI endpoints for:
 - Voice cloning synthesis
 
 The app uses:
-- Modal Volume v2 for fast model loading (8s vs 60s download)
+- XTTS v2 weights baked into the image (no network reads at model load)
+- Modal Volume v2 for persistent caches (speaker metadata, compiled graphs)
 - GPU (T4) for inference
-- Memory snapshotting for faster cold starts
+- Memory snapshotting (after CPU-side model load) for faster cold starts
 - Stale-while-revalidate caching for speaker metadata
 """
 
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import modal
 
 # ============================================================================
@@ -24,6 +29,18 @@ app = modal.App("coqui-apis")
 # Create/reference Modal Volume for model storage
 volume = modal.Volume.from_name("coqui-models-v2", create_if_missing=True)
 
+# XTTS v2 weights are baked into the image at build time (local overlayfs
+# reads instead of network Volume reads on cold start), together with the
+# flat safetensors copy used by the engine's fast load path. save_model dedupes
+# the GPT inference wrapper's shared tensors, which save_file rejects.
+BAKED_MODEL_PATH = "/opt/models/coqui"
+_BAKE_MODEL = (
+    "from TTS.api import TTS; "
+    "from safetensors.torch import save_model; "
+    "tts = TTS('tts_models/multilingual/multi-dataset/xtts_v2', progress_bar=False, gpu=False); "
+    f"save_model(tts.synthesizer.tts_model, '{BAKED_MODEL_PATH}/xtts_v2.safetensors')"
+)
+
 # Define container image with all dependencies (matches download_models.py)
 image = (
     modal.Image.debian_slim(python_version="3.12")
@@ -37,142 +54,157 @@ image = (
         "fastapi[standard]>=0.108.0",
         "pydantic>=2.5.0",
         "python-multipart",  # For file uploads
+        "orjson",  # Fast JSON serialization for metadata endpoints
     )
     .run_commands("apt-get update && apt-get install -y ffmpeg")  # Required by Coqui
+    .env({"COQUI_TOS_AGREED": "1", "TTS_HOME": BAKED_MODEL_PATH})
+    .run_commands(f'python -c "{_BAKE_MODEL}"')  # ~1.8GB model download
     .add_local_python_source("coqui_service")  # Mount coqui_service package (Modal 1.0 API)
     .add_local_python_source("shared")         # Shared audio utilities
 )
 
-# ============================================================================
-# Global State (Loaded Once Per Container)
-# ============================================================================
-
-# These will be initialized at container startup
-_tts_engine = None
-_speaker_cache = None
-_logger = None
-
-
-def get_logger():
-    """Get logger instance (initialized in fastapi_app)."""
-    return _logger
-
-
-def get_tts_engine():
-    """Get or initialize TTS engine (singleton per container)."""
-    global _tts_engine
-    if _tts_engine is None:
-        from coqui_service.engine import TTSEngine
-        import structlog
-
-        logger = structlog.get_logger()
-        logger.info("tts_engine.initializing")
-        _tts_engine = TTSEngine(model_path="/models/coqui")
-        _tts_engine.load_model()
-        logger.info("tts_engine.initialized")
-
-    return _tts_engine
-
-
-def get_speaker_cache():
-    """Get or initialize speaker cache (singleton per container)."""
-    global _speaker_cache
-    if _speaker_cache is None:
-        from coqui_service.utils.speaker_cache import SpeakerCache
-        import structlog
-
-        logger = structlog.get_logger()
-        logger.info("speaker_cache.initializing")
-        _speaker_cache = SpeakerCache(volume_path="/models/coqui")
-        logger.info("speaker_cache.initialized")
-
-    return _speaker_cache
+# Container-side imports at module scope so they are loaded before the memory
+# snapshot is taken (skipped when the app is only being deployed locally)
+with image.imports():
+    import structlog
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import ORJSONResponse
 
+    from coqui_service.batcher import TTSBatcher
+    from coqui_service.engine import TTSEngine
+    from coqui_service.routes import create_routes
+    from coqui_service.utils.result_cache import TTSResultCache
 
 # ============================================================================
 # Modal ASGI App
 # ============================================================================
 
-@app.function(
+@app.cls(
     image=image,
     gpu="T4",  # T4 GPU (16GB VRAM, sufficient for XTTS v2)
-    volumes={"/models": volume},  # Mount Volume at /models
+    volumes={"/models": volume},  # Volume for caches (speakers, Inductor graphs)
     min_containers=0,  # Scale to zero when idle (cost-optimized)
     timeout=300,  # 5 min max per request
-    enable_memory_snapshot=True,  # Faster cold starts (8s → 3s)
+    enable_memory_snapshot=True,  # Snapshot taken after CPU-side model load
     scaledown_window=120,  # Keep container alive for 2min after request
 )
-@modal.asgi_app()
-def fastapi_app():
-    """Create and configure FastAPI application.
-
-    This function is called once per container startup.
-    The returned FastAPI app handles all HTTP requests.
+# Several requests per container, so the batchers' coalescing window can
+# actually see concurrent requests (matches TTSBatcher's max_batch_size)
+@modal.concurrent(max_inputs=8)
+class CoquiApp:
+    """Coqui TTS service (one instance per container).
+
+    Model loading is split across Modal lifecycle hooks so the memory
+    snapshot already contains imported libraries and loaded weights; a
+    restored container only moves weights to the GPU and warms up.
     """
-    from fastapi import FastAPI
-    import structlog
-    from coqui_service.routes import create_routes
-
-    global _logger
-
-    # Configure structlog
-    structlog.configure(
-        processors=[
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.JSONRenderer(),
-        ],
-    )
-    logger = structlog.get_logger()
-    _logger = logger
-
-    # Create FastAPI app
-    web_app = FastAPI(
-        title="Coqui TTS API",
-        description="Text-to-Speech and Voice Cloning API powered by Coqui XTTS v2",
-        version="0.1.0",
-        docs_url="/docs",
-        redoc_url="/redoc",
-    )
-
-    # CORS middleware
-    from fastapi.middleware.cors import CORSMiddleware
-    web_app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-        expose_headers=[
-            "X-Sample-Rate", "X-Duration-Sec", "X-Engine", "X-Speaker",
-            "X-Chunks", "X-Mode", "X-Reference-Count", "X-Validation-Warnings",
-        ],
-    )
-
-    # Startup event: Pre-load model
-    @web_app.on_event("startup")
-    async def startup():
-        """Pre-load TTS model and speaker cache on container startup."""
-        logger.info("fastapi.startup")
-        try:
-            # Initialize engine (loads model from Volume)
-            engine = get_tts_engine()
-            logger.info("fastapi.startup.engine_loaded", speakers=len(engine.get_speakers()))
-
-            # Initialize speaker cache
-            cache = get_speaker_cache()
-            logger.info("fastapi.startup.cache_initialized")
-
-        except Exception as e:
-            logger.error("fastapi.startup.failed", error=str(e))
-            raise
-
-    # Register routes
-    create_routes(
-        app=web_app,
-        engine=get_tts_engine(),
-        speaker_cache=get_speaker_cache(),
-        volume=volume,
-    )
 
-    logger.info("fastapi.app_created")
-    return web_app
+    @modal.enter(snap=True)
+    def load_cpu(self):
+        """Load weights on CPU (captured in snapshot)."""
+        # Configure structlog
+        # Filtering bound logger: calls below LOG_LEVEL (default INFO) are
+        # no-op methods, so per-chunk debug lines cost nothing in production
+        log_level = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO").upper())
+        structlog.configure(
+            processors=[
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.JSONRenderer(),
+            ],
+            wrapper_class=structlog.make_filtering_bound_logger(
+                log_level if isinstance(log_level, int) else logging.INFO
+            ),
+            cache_logger_on_first_use=True,
+        )
+        self.logger = structlog.get_logger()
+
+        self.logger.info("tts_engine.initializing")
+        self.engine = TTSEngine(model_path=BAKED_MODEL_PATH, cache_path="/models/coqui")
+        self.engine.load_weights(gpu=False)
+
+    @modal.enter(snap=False)
+    def load_gpu(self):
+        """Move the model to the GPU and warm it up (after snapshot restore).
+
+        Warmup runs a short synthesis so Inductor compilation happens before
+        the first user request (and is reverted to eager if it fails).
+        """
+        self.engine.activate(device="cuda")
+        self.logger.info("tts_engine.initialized", speakers=len(self.engine.get_speakers()))
+
+    @modal.asgi_app(label="coqui-apis-fastapi-app")
+    def fastapi_app(self):
+        """Create and configure FastAPI application.
+
+        This function is called once per container startup.
+        The returned FastAPI app handles all HTTP requests.
+        """
+        logger = self.logger
+
+        # One thread owns the model so GPU work never interleaves; numpy
+        # post-processing gets its own small pool
+        synth_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="xtts")
+        cpu_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="audio")
+
+        batcher = TTSBatcher(engine=self.engine, executor=synth_executor)
+        clone_batcher = TTSBatcher(
+            engine=self.engine,
+            synthesize_fn=self.engine.synthesize_clone_requests,
+            executor=synth_executor,
+        )
+
+        # Create FastAPI app
+        web_app = FastAPI(
+            title="Coqui TTS API",
+            description="Text-to-Speech and Voice Cloning API powered by Coqui XTTS v2",
+            version="0.1.0",
+            docs_url="/docs",
+            redoc_url="/redoc",
+            default_response_class=ORJSONResponse,
+        )
+        web_app.state.synth_executor = synth_executor
+        web_app.state.cpu_executor = cpu_executor
+
+        # CORS middleware
+        web_app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+            expose_headers=[
+                "X-Sample-Rate", "X-Duration-Sec", "X-Engine", "X-Speaker",
+                "X-Chunks", "X-Mode", "X-Reference-Count", "X-Validation-Warnings",
+                "X-Conditioning-Cached", "X-Cache",
+            ],
+        )
+
+        # Startup event: model is already loaded by the enter hooks
+        @web_app.on_event("startup")
+        async def startup():
+            """Start the micro-batching consumers on the serving event loop."""
+            logger.info("fastapi.startup")
+            batcher.start()
+            clone_batcher.start()
+
+        @web_app.on_event("shutdown")
+        async def shutdown():
+            """Release the executor threads."""
+            synth_executor.shutdown(wait=False, cancel_futures=True)
+            cpu_executor.shutdown(wait=False, cancel_futures=True)
+
+        # Register routes
+        create_routes(
+            app=web_app,
+            engine=self.engine,
+            volume=volume,
+            batcher=batcher,
+            clone_batcher=clone_batcher,
+            synth_executor=synth_executor,
+            cpu_executor=cpu_executor,
+            result_cache=TTSResultCache(volume_path="/models/coqui"),
+        )
+
+        logger.info("fastapi.app_created")
+        return web_app
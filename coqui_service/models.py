@@ -61,6 +61,14 @@ class HealthResponse(BaseModel):
     model_loaded: bool = Field(..., description="Whether TTS model is loaded")
     speakers_available: int = Field(..., description="Number of speakers available")
     version: str = Field(..., description="Service version")
+    dtype: Optional[str] = Field(None, description="Decoder inference dtype (float32, float16, bfloat16)")
+
+
+class CacheClearResponse(BaseModel):
+    """Response model for the TTS result cache clear endpoint."""
+
+    cleared: bool = Field(..., description="Whether the cache was cleared")
+    files_removed: int = Field(..., description="Number of cached WAV files deleted from the Volume")
 
 
 class ErrorDetail(BaseModel):
@@ -1,44 +1,493 @@
-"""FastAPI route handlers for Coqui TTS API."""
-
-from typing import List
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
-from fastapi.responses import Response
+"""FastAPI route handlers for Coqui TTS API.
+
+Handlers never touch the model or torch tensors themselves: all synthesis
+runs on the single-threaded synth executor (through the batchers, or
+_iterate_in for streams) and numpy post-processing on the CPU executor, so
+the event loop stays free to accept, validate and chunk new requests.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File, Form
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
 import structlog
 
 from coqui_service.models import (
     TTSRequest,
-    VoiceCloneRequest,
     SpeakersResponse,
     HealthResponse,
-    ErrorResponse,
-    ErrorDetail,
+    CacheClearResponse,
     APIInfoResponse,
     APIEndpointInfo,
 )
-from coqui_service.engine import TTSEngine
-from coqui_service.utils.speaker_cache import SpeakerCache
+from coqui_service.batcher import TTSBatcher
+from coqui_service.engine import TextTooLongError, TTSEngine
+from coqui_service.utils.result_cache import TTSResultCache
 from coqui_service.utils.chunker import chunk_text
 from coqui_service.utils.audio import (
-    stitch_audio_chunks,
-    normalize_audio,
+    PCMAssembler,
     wrap_wav,
-    estimate_duration,
+    wav_header_streaming,
     validate_reference_audio,
 )
 
 logger = structlog.get_logger()
 
+# Rough speech rate (~15 chars/sec), used to presize the stitch buffer
+_SECONDS_PER_CHAR = 0.07
+
+# Reference uploads are read in blocks and rejected as soon as they exceed this
+_MAX_REFERENCE_BYTES = 10 * 1024 * 1024
+_UPLOAD_READ_BLOCK = 256 * 1024
+
+
+async def _read_upload_capped(upload: UploadFile, index: int, max_bytes: int) -> bytes:
+    """Read an upload in blocks, failing with 413 once it exceeds max_bytes.
+
+    Raises:
+        HTTPException: 413 if the file is larger than max_bytes
+    """
+    def too_large(size: int) -> HTTPException:
+        logger.warning(
+            "upload.rejected_too_large",
+            file_index=index,
+            filename=upload.filename,
+            size=size,
+            max_bytes=max_bytes,
+        )
+        return HTTPException(
+            status_code=413,
+            detail=f"Reference audio {index+1} too large (max {max_bytes // (1024 * 1024)}MB)",
+        )
 
-def create_routes(app: FastAPI, engine: TTSEngine, speaker_cache: SpeakerCache, volume) -> None:
+    # Starlette records the spooled size, so oversized files can fail unread
+    if upload.size is not None and upload.size > max_bytes:
+        raise too_large(upload.size)
+
+    parts = []
+    size = 0
+    while block := await upload.read(_UPLOAD_READ_BLOCK):
+        size += len(block)
+        if size > max_bytes:
+            raise too_large(size)
+        parts.append(block)
+
+    return b"".join(parts)
+
+
+# Request bodies above this size are validated off the event loop
+_INLINE_VALIDATE_BYTES = 2048
+
+# /tts handlers read the raw body themselves; keep the schema in the docs
+_TTS_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": TTSRequest.model_json_schema()}},
+    }
+}
+
+# /api-info never changes at runtime: build and serialize it once at import
+_API_INFO = APIInfoResponse(
+    service="Coqui TTS & Voice Cloning API",
+    version="0.1.0",
+    endpoints=[
+        APIEndpointInfo(
+            endpoint="/tts",
+            method="POST",
+            description="Generate speech from text using built-in speakers",
+            inputs={
+                "text": "string (1-5000 chars) - Text to synthesize",
+                "speaker_id": "string - Built-in speaker name (e.g., 'Claribel Dervla')",
+                "language": "string - Language code (en, es, fr, de, it, pt, pl, tr, ru, nl, cs, ar, zh-cn, ja, hu, ko, hi)",
+                "speed": "float (0.7-1.3) - Speech speed multiplier (default: 1.0)",
+                "output_format": "string - Audio format (default: wav)"
+            },
+            outputs={
+                "content_type": "audio/wav",
+                "headers": {
+                    "X-Sample-Rate": "Sample rate in Hz (e.g., 24000)",
+                    "X-Duration-Sec": "Audio duration in seconds",
+                    "X-Engine": "TTS engine used (coqui_xtts)",
+                    "X-Speaker": "Speaker name used",
+                    "X-Chunks": "Number of text chunks processed",
+                    "X-Cache": "hit if served from the result cache, else miss"
+                }
+            },
+            example='curl -X POST https://[ENDPOINT]/tts -H "Content-Type: application/json" -d \'{"text": "Hello world", "speaker_id": "Claribel Dervla", "language": "en"}\' --output audio.wav'
+        ),
+        APIEndpointInfo(
+            endpoint="/tts/stream",
+            method="POST",
+            description="Stream speech from text as WAV while it is generated",
+            inputs={
+                "text": "string (1-5000 chars) - Text to synthesize",
+                "speaker_id": "string - Built-in speaker name (e.g., 'Claribel Dervla')",
+                "language": "string - Language code (same as /tts)"
+            },
+            outputs={
+                "content_type": "audio/wav (open-ended data size)",
+                "headers": {
+                    "X-Sample-Rate": "Sample rate in Hz (e.g., 24000)",
+                    "X-Engine": "TTS engine used (coqui_xtts)",
+                    "X-Speaker": "Speaker name used",
+                    "X-Chunks": "Number of text chunks processed"
+                }
+            },
+            example='curl -N -X POST https://[ENDPOINT]/tts/stream -H "Content-Type: application/json" -d \'{"text": "Hello world", "speaker_id": "Claribel Dervla", "language": "en"}\' --output audio.wav'
+        ),
+        APIEndpointInfo(
+            endpoint="/speakers",
+            method="GET",
+            description="List all available built-in speakers (58 speakers)",
+            inputs={},
+            outputs={
+                "content_type": "application/json",
+                "fields": {
+                    "speakers": "List of speaker names",
+                    "count": "Total number of speakers (58)",
+                    "last_updated": "ISO timestamp of when the list was read from the model",
+                    "cache_age_days": "Days since last_updated"
+                }
+            },
+            example="curl https://[ENDPOINT]/speakers | jq"
+        ),
+        APIEndpointInfo(
+            endpoint="/voice-clone",
+            method="POST",
+            description="Clone a voice from reference audio and generate speech",
+            inputs={
+                "text": "string (1-5000 chars) - Text to synthesize",
+                "language": "string - Language code (same as /tts)",
+                "reference_audio": "file[] - 1-5 audio files (WAV/MP3/M4A, 3-30s each, <10MB, 6-10s optimal)"
+            },
+            outputs={
+                "content_type": "audio/wav",
+                "headers": {
+                    "X-Sample-Rate": "Sample rate in Hz",
+                    "X-Duration-Sec": "Audio duration in seconds",
+                    "X-Engine": "TTS engine (coqui_xtts)",
+                    "X-Mode": "voice_clone",
+                    "X-Reference-Count": "Number of reference files used",
+                    "X-Conditioning-Cached": "hit if the reference set's latents were already cached, else miss",
+                    "X-Validation-Warnings": "Audio quality warnings (if any)"
+                }
+            },
+            example='curl -X POST https://[ENDPOINT]/voice-clone -F "text=Hello from cloned voice" -F "language=en" -F "reference_audio=@voice.wav" --output cloned.wav'
+        ),
+        APIEndpointInfo(
+            endpoint="/voice-clone/stream",
+            method="POST",
+            description="Stream voice-cloned speech as WAV while it is generated",
+            inputs={
+                "text": "string (1-5000 chars) - Text to synthesize",
+                "language": "string - Language code (same as /tts)",
+                "reference_audio": "file[] - 1-5 audio files (same rules as /voice-clone)"
+            },
+            outputs={
+                "content_type": "audio/wav (open-ended data size)",
+                "headers": {
+                    "X-Sample-Rate": "Sample rate in Hz",
+                    "X-Engine": "TTS engine (coqui_xtts)",
+                    "X-Mode": "voice_clone",
+                    "X-Chunks": "Number of text chunks processed",
+                    "X-Reference-Count": "Number of reference files used",
+                    "X-Conditioning-Cached": "hit if the reference set's latents were already cached, else miss",
+                    "X-Validation-Warnings": "Audio quality warnings (if any)"
+                }
+            },
+            example='curl -N -X POST https://[ENDPOINT]/voice-clone/stream -F "text=Hello from cloned voice" -F "language=en" -F "reference_audio=@voice.wav" --output cloned.wav'
+        ),
+        APIEndpointInfo(
+            endpoint="/cache/clear",
+            method="POST",
+            description="Clear the /tts result cache (memory and Volume)",
+            inputs={},
+            outputs={
+                "content_type": "application/json",
+                "fields": {
+                    "cleared": "boolean",
+                    "files_removed": "number of cached WAV files deleted"
+                }
+            },
+            example="curl -X POST https://[ENDPOINT]/cache/clear | jq"
+        ),
+        APIEndpointInfo(
+            endpoint="/health",
+            method="GET",
+            description="Check service health and model status",
+            inputs={},
+            outputs={
+                "content_type": "application/json",
+                "fields": {
+                    "status": "healthy/unhealthy",
+                    "model_loaded": "boolean",
+                    "speakers_available": "number of speakers",
+                    "version": "API version",
+                    "dtype": "decoder inference dtype (float32/float16/bfloat16)"
+                }
+            },
+            example="curl https://[ENDPOINT]/health | jq"
+        )
+    ]
+)
+_API_INFO_BYTES = _API_INFO.model_dump_json().encode("utf-8")
+
+
+def _err(code: str, message: str, valid_options: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Error body in the ErrorResponse shape, built as a plain dict.
+
+    Same JSON as ``ErrorResponse(error=ErrorDetail(...)).model_dump()``
+    without Pydantic construction and validation on every error.
+    """
+    return {
+        "error": {
+            "code": code,
+            "message": message,
+            "valid_options": valid_options,
+            "request_id": None,
+        }
+    }
+
+
+def _text_too_long(e: TextTooLongError) -> HTTPException:
+    """400 for a chunk over the XTTS token limit (the speaker list is no help here)."""
+    return HTTPException(status_code=400, detail=_err("text_too_long", str(e)))
+
+
+async def _assemble_chunks(
+    pcm_tasks: List[asyncio.Future],
+    sample_rate: int,
+    text_len: int,
+    executor: Executor,
+) -> memoryview:
+    """Stitch and normalize chunk audio while later chunks are still decoding.
+
+    A producer awaits the chunk results in order and queues them; a consumer
+    crossfades each one into a PCMAssembler on the CPU executor, so the CPU
+    post-processing overlaps synthesis and only the final gain pass is left
+    once the last chunk lands. Returns a byte view of the assembler's buffer
+    so wrap_wav copies the PCM exactly once.
+    """
+    loop = asyncio.get_running_loop()
+    assembler = PCMAssembler(
+        sample_rate,
+        crossfade_ms=40,
+        expected_samples=int(text_len * _SECONDS_PER_CHAR * sample_rate),
+    )
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def produce():
+        try:
+            for task in pcm_tasks:
+                await queue.put(await task)
+        except BaseException:
+            for task in pcm_tasks:
+                task.cancel()
+            raise
+        finally:
+            await queue.put(None)
+
+    async def consume():
+        while (pcm := await queue.get()) is not None:
+            await loop.run_in_executor(executor, assembler.append, pcm)
+
+    await asyncio.gather(produce(), consume())
+    return await loop.run_in_executor(executor, assembler.finish_view)
+
+
+async def _iterate_in(executor: Executor, iterator: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """Drive a blocking iterator one step at a time on the given executor."""
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await loop.run_in_executor(executor, next, iterator, None)
+        if item is None:
+            break
+        yield item
+
+
+def create_routes(
+    app: FastAPI,
+    engine: TTSEngine,
+    volume,
+    batcher: TTSBatcher,
+    clone_batcher: TTSBatcher,
+    synth_executor: Executor,
+    cpu_executor: Executor,
+    result_cache: TTSResultCache,
+) -> None:
     """Create and register all API routes.
 
     Args:
         app: FastAPI application instance
         engine: TTS engine instance
-        speaker_cache: Speaker cache instance
         volume: Modal Volume instance
+        batcher: Micro-batching queue for built-in speaker synthesis
+        clone_batcher: Micro-batching queue for voice-clone synthesis
+        synth_executor: Single-threaded executor that owns all model calls
+        cpu_executor: Executor for numpy post-processing (stitch/normalize)
+        result_cache: Cache of finished /tts WAV responses
     """
 
+    async def _stream_wav(pcm_chunks: Iterator[bytes], log_event: str) -> AsyncIterator[bytes]:
+        """Prefix streamed PCM16 with a WAV header and log the final duration.
+
+        The engine generator is stepped on the synth executor so streamed
+        decodes serialize with batched ones instead of racing them on the
+        GPU from Starlette's threadpool.
+        """
+        yield wav_header_streaming(sample_rate=engine.sample_rate)
+
+        streamed = 0
+        async for pcm in _iterate_in(synth_executor, pcm_chunks):
+            streamed += len(pcm)
+            yield pcm
+
+        logger.info(
+            log_event,
+            audio_size=streamed,
+            duration_sec=(streamed // 2) / engine.sample_rate,
+        )
+
+    async def _read_reference_audio(
+        reference_audio: List[UploadFile], log_prefix: str
+    ) -> Tuple[List[bytes], List[str]]:
+        """Read and validate uploaded reference clips.
+
+        Returns:
+            Tuple of (reference audio bytes, validation warnings)
+
+        Raises:
+            HTTPException: If the file count is wrong, a clip is too large
+                (413) or a clip is invalid
+        """
+        # Validate number of reference files
+        if not reference_audio:
+            raise HTTPException(
+                status_code=400,
+                detail="At least one reference audio file is required",
+            )
+
+        if len(reference_audio) > 5:
+            raise HTTPException(
+                status_code=400,
+                detail="Maximum 5 reference audio files allowed",
+            )
+
+        # Read all uploads (capped), then validate them concurrently on the CPU pool
+        loop = asyncio.get_running_loop()
+        ref_audio_bytes_list = list(
+            await asyncio.gather(
+                *(
+                    _read_upload_capped(audio_file, idx, _MAX_REFERENCE_BYTES)
+                    for idx, audio_file in enumerate(reference_audio)
+                )
+            )
+        )
+        validations = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    cpu_executor,
+                    validate_reference_audio,
+                    audio_bytes,
+                    _MAX_REFERENCE_BYTES / (1024 * 1024),
+                )
+                for audio_bytes in ref_audio_bytes_list
+            ),
+            return_exceptions=True,
+        )
+
+        validation_warnings = []
+
+        for idx, validation in enumerate(validations):
+            if isinstance(validation, Exception):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Reference audio {idx+1} invalid: {validation}",
+                )
+
+            if not validation.is_valid:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Reference audio {idx+1} invalid: {validation.error_message}",
+                )
+
+            # Collect warnings
+            if validation.warning_message:
+                validation_warnings.append(f"File {idx+1}: {validation.warning_message}")
+
+            logger.info(
+                f"{log_prefix}.audio_validated",
+                file_index=idx,
+                duration=validation.duration,
+                sample_rate=validation.sample_rate,
+                channels=validation.channels,
+            )
+
+        return ref_audio_bytes_list, validation_warnings
+
+    async def _prepare_conditioning(
+        ref_audio_bytes_list: List[bytes],
+    ) -> Tuple[Tuple[Any, Any], bool]:
+        """Resolve the reference set's latents, and whether they were already cached.
+
+        Hashing, decoding and resampling run on the CPU pool (once per
+        reference set, and only on a cache miss), so the synth thread only
+        does the pinned host-to-device copy and the encoder passes. The
+        latents are handed to the clone batcher as-is, so a later LRU
+        eviction can't send a chunk back through the encoders.
+        """
+        loop = asyncio.get_running_loop()
+        key = await loop.run_in_executor(
+            cpu_executor, engine.reference_key, ref_audio_bytes_list
+        )
+
+        prepared = None
+        if not engine.has_conditioning(key):
+            prepared = await loop.run_in_executor(
+                cpu_executor, engine.prepare_references, ref_audio_bytes_list
+            )
+
+        return await loop.run_in_executor(
+            synth_executor,
+            functools.partial(
+                engine.compute_conditioning,
+                ref_audio_bytes_list,
+                prepared=prepared,
+                key=key,
+            ),
+        )
+
+    async def _parse_tts_request(raw_request: Request) -> TTSRequest:
+        """Parse and validate a TTSRequest body.
+
+        Uses pydantic-core's JSON parser directly (no json.loads + dict
+        validation); bodies large enough to cost real time (long or CJK
+        text) are validated on the CPU pool instead of the event loop.
+
+        Raises:
+            RequestValidationError: Rendered by FastAPI as the usual 422
+        """
+        body = await raw_request.body()
+        try:
+            if len(body) > _INLINE_VALIDATE_BYTES:
+                return await asyncio.get_running_loop().run_in_executor(
+                    cpu_executor, TTSRequest.model_validate_json, body
+                )
+            return TTSRequest.model_validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ],
+                body=body,
+            )
+
     @app.get("/health", response_model=HealthResponse)
     async def health_check():
         """Health check endpoint."""
@@ -49,6 +498,7 @@ def create_routes(app: FastAPI, engine: TTSEngine, speaker_cache: SpeakerCache,
                 model_loaded=engine._loaded,
                 speakers_available=len(speakers),
                 version="0.1.0",
+                dtype=engine.dtype,
             )
         except Exception as e:
             logger.error("health_check.failed", error=str(e))
@@ -56,139 +506,75 @@ def create_routes(app: FastAPI, engine: TTSEngine, speaker_cache: SpeakerCache,
 
     @app.get("/api-info", response_model=APIInfoResponse)
     async def api_info():
-        """Get API usage documentation for all endpoints."""
-        return APIInfoResponse(
-            service="Coqui TTS & Voice Cloning API",
-            version="0.1.0",
-            endpoints=[
-                APIEndpointInfo(
-                    endpoint="/tts",
-                    method="POST",
-                    description="Generate speech from text using built-in speakers",
-                    inputs={
-                        "text": "string (1-5000 chars) - Text to synthesize",
-                        "speaker_id": "string - Built-in speaker name (e.g., 'Claribel Dervla')",
-                        "language": "string - Language code (en, es, fr, de, it, pt, pl, tr, ru, nl, cs, ar, zh-cn, ja, hu, ko, hi)",
-                        "speed": "float (0.7-1.3) - Speech speed multiplier (default: 1.0)",
-                        "output_format": "string - Audio format (default: wav)"
-                    },
-                    outputs={
-                        "content_type": "audio/wav",
-                        "headers": {
-                            "X-Sample-Rate": "Sample rate in Hz (e.g., 24000)",
-                            "X-Duration-Sec": "Audio duration in seconds",
-                            "X-Engine": "TTS engine used (coqui_xtts)",
-                            "X-Speaker": "Speaker name used",
-                            "X-Chunks": "Number of text chunks processed"
-                        }
-                    },
-                    example='curl -X POST https://[ENDPOINT]/tts -H "Content-Type: application/json" -d \'{"text": "Hello world", "speaker_id": "Claribel Dervla", "language": "en"}\' --output audio.wav'
-                ),
-                APIEndpointInfo(
-                    endpoint="/speakers",
-                    method="GET",
-                    description="List all available built-in speakers (58 speakers)",
-                    inputs={
-                        "refresh": "boolean (optional) - Force rebuild speaker cache (default: false)"
-                    },
-                    outputs={
-                        "content_type": "application/json",
-                        "fields": {
-                            "speakers": "List of speaker names",
-                            "count": "Total number of speakers (58)",
-                            "last_updated": "ISO timestamp of cache update",
-                            "cache_age_days": "Age of cached data in days"
-                        }
-                    },
-                    example="curl https://[ENDPOINT]/speakers | jq"
-                ),
-                APIEndpointInfo(
-                    endpoint="/voice-clone",
-                    method="POST",
-                    description="Clone a voice from reference audio and generate speech",
-                    inputs={
-                        "text": "string (1-5000 chars) - Text to synthesize",
-                        "language": "string - Language code (same as /tts)",
-                        "reference_audio": "file[] - 1-5 audio files (WAV/MP3/M4A, 3-30s each, <10MB, 6-10s optimal)"
-                    },
-                    outputs={
-                        "content_type": "audio/wav",
-                        "headers": {
-                            "X-Sample-Rate": "Sample rate in Hz",
-                            "X-Duration-Sec": "Audio duration in seconds",
-                            "X-Engine": "TTS engine (coqui_xtts)",
-                            "X-Mode": "voice_clone",
-                            "X-Reference-Count": "Number of reference files used",
-                            "X-Validation-Warnings": "Audio quality warnings (if any)"
-                        }
-                    },
-                    example='curl -X POST https://[ENDPOINT]/voice-clone -F "text=Hello from cloned voice" -F "language=en" -F "reference_audio=@voice.wav" --output cloned.wav'
-                ),
-                APIEndpointInfo(
-                    endpoint="/health",
-                    method="GET",
-                    description="Check service health and model status",
-                    inputs={},
-                    outputs={
-                        "content_type": "application/json",
-                        "fields": {
-                            "status": "healthy/unhealthy",
-                            "model_loaded": "boolean",
-                            "speakers_available": "number of speakers",
-                            "version": "API version"
-                        }
-                    },
-                    example="curl https://[ENDPOINT]/health | jq"
-                )
-            ]
-        )
+        """Get API usage documentation for all endpoints.
+
+        Returns the pre-serialized body; response_model still documents the
+        schema, and FastAPI passes a Response through without re-validating.
+        """
+        return Response(content=_API_INFO_BYTES, media_type="application/json")
+
+    # The built-in speakers are fixed in the checkpoint and read once at
+    # model load; /speakers serves that in-memory list (no Volume state)
+    speakers_loaded_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
     @app.get("/speakers", response_model=SpeakersResponse)
-    async def list_speakers(refresh: bool = False):
-        """List available speakers with caching.
+    async def list_speakers(response: Response):
+        """List the model's built-in speakers.
 
         Args:
-            refresh: Force cache refresh if True
+            response: Outgoing response (for cache headers)
 
         Returns:
             SpeakersResponse with speakers list and metadata
         """
         try:
-            result = await speaker_cache.get_speakers(
-                tts_model=engine.tts,
-                volume=volume,
-                force_refresh=refresh,
+            # Speaker list only changes with the model; let clients and
+            # proxies reuse it
+            response.headers["Cache-Control"] = (
+                "public, max-age=86400, stale-while-revalidate=604800"
             )
 
+            speakers = engine.get_speakers()
             return SpeakersResponse(
-                speakers=result["speakers"],
-                count=result["count"],
-                last_updated=result["last_updated"],
-                cache_age_days=result["cache_age_days"],
+                speakers=speakers,
+                count=len(speakers),
+                last_updated=speakers_loaded_at,
+                cache_age_days=(
+                    datetime.now(timezone.utc).replace(tzinfo=None) - speakers_loaded_at
+                ).days,
             )
 
         except Exception as e:
             logger.error("list_speakers.failed", error=str(e))
             raise HTTPException(
                 status_code=500,
-                detail=ErrorResponse(
-                    error=ErrorDetail(
-                        code="speaker_list_failed",
-                        message=f"Failed to retrieve speaker list: {str(e)}",
-                    )
-                ).model_dump(),
+                detail=_err(
+                    "speaker_list_failed",
+                    f"Failed to retrieve speaker list: {str(e)}",
+                ),
             )
 
-    @app.post("/tts")
-    async def text_to_speech(request: TTSRequest):
+    @app.post("/cache/clear", response_model=CacheClearResponse)
+    async def clear_cache():
+        """Drop all cached /tts results (memory and Volume)."""
+        files_removed = await asyncio.get_running_loop().run_in_executor(
+            cpu_executor, result_cache.clear, volume
+        )
+        return CacheClearResponse(cleared=True, files_removed=files_removed)
+
+    @app.post("/tts", openapi_extra=_TTS_REQUEST_BODY)
+    async def text_to_speech(raw_request: Request):
         """Synthesize speech from text using built-in speaker.
 
         Args:
-            request: TTS request with text, speaker_id, language
+            raw_request: HTTP request whose JSON body is a TTSRequest
+                (text, speaker_id, language)
 
         Returns:
             WAV audio file
         """
+        request = await _parse_tts_request(raw_request)
+
         try:
             logger.info(
                 "tts.request",
@@ -205,29 +591,53 @@ def create_routes(app: FastAPI, engine: TTSEngine, speaker_cache: SpeakerCache,
 
             logger.info("tts.chunking", chunk_count=len(chunks))
 
-            # Synthesize each chunk
-            audio_chunks = []
-            for idx, chunk in enumerate(chunks):
-                logger.debug("tts.chunk", index=idx, text=chunk[:50])
-                pcm = engine.synthesize_builtin(
-                    text=chunk,
-                    speaker_id=request.speaker_id,
-                    language=request.language,
-                )
-                audio_chunks.append(pcm)
-
-            # Stitch chunks together
-            if len(audio_chunks) > 1:
-                combined_pcm = stitch_audio_chunks(
-                    audio_chunks,
-                    sample_rate=engine.sample_rate,
-                    crossfade_ms=40,
+            # Validate speaker before queueing any work
+            engine.get_builtin_latents(request.speaker_id)
+
+            def tts_response(wav_bytes: bytes, cache_status: str) -> Response:
+                duration = ((len(wav_bytes) - 44) // 2) / engine.sample_rate
+                return Response(
+                    content=wav_bytes,
+                    media_type="audio/wav",
+                    headers={
+                        "X-Sample-Rate": str(engine.sample_rate),
+                        "X-Duration-Sec": f"{duration:.2f}",
+                        "X-Engine": "coqui_xtts",
+                        "X-Speaker": request.speaker_id,
+                        "X-Chunks": str(len(chunks)),
+                        "X-Cache": cache_status,
+                    },
                 )
-            else:
-                combined_pcm = audio_chunks[0]
 
-            # Normalize audio
-            normalized_pcm = normalize_audio(combined_pcm)
+            # Repeated prompts are served from memory, then from the Volume
+            loop = asyncio.get_running_loop()
+            cache_key = TTSResultCache.make_key(
+                request.text, request.speaker_id, request.language, engine.sample_rate
+            )
+            cached_wav = result_cache.get(cache_key)
+            if cached_wav is None:
+                cached_wav = await loop.run_in_executor(
+                    cpu_executor, result_cache.load, cache_key
+                )
+            if cached_wav is not None:
+                logger.info("tts.cache_hit", audio_size=len(cached_wav))
+                return tts_response(cached_wav, "hit")
+
+            # Submit all chunks to the batcher; they decode together with
+            # any concurrent requests that land in the same window, and each
+            # one is stitched in as soon as it is ready
+            pcm_tasks = [
+                asyncio.ensure_future(
+                    batcher.submit(chunk, request.speaker_id, request.language)
+                )
+                for chunk in chunks
+            ]
+            normalized_pcm = await _assemble_chunks(
+                pcm_tasks,
+                sample_rate=engine.sample_rate,
+                text_len=len(request.text),
+                executor=cpu_executor,
+            )
 
             # Wrap in WAV container
             wav_bytes = wrap_wav(
@@ -235,58 +645,129 @@ def create_routes(app: FastAPI, engine: TTSEngine, speaker_cache: SpeakerCache,
                 sample_rate=engine.sample_rate,
             )
 
-            # Calculate duration
-            duration = estimate_duration(
-                normalized_pcm,
-                sample_rate=engine.sample_rate,
-                sample_width=2,
-                channels=1,
-            )
+            # Duration straight from the sample count (mono PCM16)
+            duration = (len(normalized_pcm) // 2) / engine.sample_rate
 
             logger.info(
                 "tts.complete",
                 audio_size=len(wav_bytes),
                 duration_sec=duration,
-                chunks=len(audio_chunks),
+                chunks=len(chunks),
             )
 
-            return Response(
-                content=wav_bytes,
+            # Memory tier now; the Volume write happens off the response path
+            result_cache.put(cache_key, wav_bytes)
+            loop.run_in_executor(cpu_executor, result_cache.persist, cache_key, wav_bytes)
+
+            return tts_response(wav_bytes, "miss")
+
+        except TextTooLongError as e:
+            logger.warning("tts.text_too_long", error=str(e))
+            raise _text_too_long(e)
+
+        except ValueError as e:
+            # Invalid speaker or language
+            logger.warning("tts.invalid_input", error=str(e))
+            speakers = engine.get_speakers()
+            raise HTTPException(
+                status_code=400,
+                detail=_err(
+                    "invalid_speaker",
+                    str(e),
+                    valid_options=speakers[:10],  # First 10 speakers as hint
+                ),
+            )
+
+        except Exception as e:
+            logger.error("tts.failed", error=str(e))
+            raise HTTPException(
+                status_code=500,
+                detail=_err(
+                    "synthesis_failed",
+                    f"TTS synthesis failed: {str(e)}",
+                ),
+            )
+
+    @app.post("/tts/stream", openapi_extra=_TTS_REQUEST_BODY)
+    async def text_to_speech_stream(raw_request: Request):
+        """Stream speech from text using built-in speaker.
+
+        A WAV header with an open-ended data size is sent first, then PCM16
+        (mono) as it is generated, so the first samples arrive after a single
+        decode step instead of after the whole utterance.
+
+        Args:
+            raw_request: HTTP request whose JSON body is a TTSRequest
+
+        Returns:
+            Streaming audio/wav response
+        """
+        request = await _parse_tts_request(raw_request)
+
+        try:
+            logger.info(
+                "tts_stream.request",
+                speaker=request.speaker_id,
+                language=request.language,
+                text_len=len(request.text),
+            )
+
+            # Validate speaker before the response starts streaming
+            engine.get_builtin_latents(request.speaker_id)
+
+            chunks = chunk_text(request.text, max_chars=200, max_words=60)
+
+            if not chunks:
+                raise HTTPException(status_code=400, detail="Empty text input")
+
+            logger.info("tts_stream.chunking", chunk_count=len(chunks))
+
+            def generate_pcm():
+                for chunk in chunks:
+                    yield from engine.synthesize_builtin_stream(
+                        text=chunk,
+                        speaker_id=request.speaker_id,
+                        language=request.language,
+                    )
+
+            return StreamingResponse(
+                _stream_wav(generate_pcm(), "tts_stream.complete"),
                 media_type="audio/wav",
                 headers={
                     "X-Sample-Rate": str(engine.sample_rate),
-                    "X-Duration-Sec": f"{duration:.2f}",
                     "X-Engine": "coqui_xtts",
                     "X-Speaker": request.speaker_id,
-                    "X-Chunks": str(len(audio_chunks)),
+                    "X-Chunks": str(len(chunks)),
                 },
             )
 
+        except HTTPException:
+            raise
+
+        except TextTooLongError as e:
+            logger.warning("tts_stream.text_too_long", error=str(e))
+            raise _text_too_long(e)
+
         except ValueError as e:
-            # Invalid speaker or language
-            logger.warning("tts.invalid_input", error=str(e))
+            logger.warning("tts_stream.invalid_input", error=str(e))
             speakers = engine.get_speakers()
             raise HTTPException(
                 status_code=400,
-                detail=ErrorResponse(
-                    error=ErrorDetail(
-                        code="invalid_speaker",
-                        message=str(e),
-                        valid_options=speakers[:10],  # First 10 speakers as hint
-                    )
-                ).model_dump(),
+                detail=_err(
+                    "invalid_speaker",
+                    str(e),
+                    valid_options=speakers[:10],
+                ),
             )
 
         except Exception as e:
-            logger.error("tts.failed", error=str(e))
+            logger.error("tts_stream.failed", error=str(e))
             raise HTTPException(
                 status_code=500,
-                detail=ErrorResponse(
-                    error=ErrorDetail(
-                        code="synthesis_failed",
-                        message=f"TTS synthesis failed: {str(e)}",
-                    )
-                ).model_dump(),
+                detail=_err(
+                    "synthesis_failed",
+                    f"TTS streaming failed: {str(e)}",
+                ),
             )
 
     @app.post("/voice-clone")
@@ -316,49 +797,9 @@ def create_routes(app: FastAPI, engine: TTSEngine, speaker_cache: SpeakerCache,
                 ref_audio_count=len(reference_audio),
             )
 
-            # Validate number of reference files
-            if not reference_audio:
-                raise HTTPException(
-                    status_code=400,
-                    detail="At least one reference audio file is required",
-                )
-
-            if len(reference_audio) > 5:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Maximum 5 reference audio files allowed",
-                )
-
-            # Read and validate all reference audio files
-            ref_audio_bytes_list = []
-            validation_warnings = []
-
-            for idx, audio_file in enumerate(reference_audio):
-                # Read file
-                audio_bytes = await audio_file.read()
-
-                # Validate reference audio
-                validation = validate_reference_audio(audio_bytes, max_size_mb=10.0)
-
-                if not validation.is_valid:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Reference audio {idx+1} invalid: {validation.error_message}",
-                    )
-
-                # Collect warnings
-                if validation.warning_message:
-                    validation_warnings.append(f"File {idx+1}: {validation.warning_message}")
-
-                ref_audio_bytes_list.append(audio_bytes)
-
-                logger.info(
-                    "voice_clone.audio_validated",
-                    file_index=idx,
-                    duration=validation.duration,
-                    sample_rate=validation.sample_rate,
-                    channels=validation.channels,
-                )
+            ref_audio_bytes_list, validation_warnings = await _read_reference_audio(
+                reference_audio, "voice_clone"
+            )
 
             # Chunk text
             chunks = chunk_text(text, max_chars=200, max_words=60)
@@ -368,29 +809,25 @@ def create_routes(app: FastAPI, engine: TTSEngine, speaker_cache: SpeakerCache,
 
             logger.info("voice_clone.chunking", chunk_count=len(chunks))
 
-            # Synthesize each chunk with voice cloning
-            audio_chunks = []
-            for idx, chunk in enumerate(chunks):
-                logger.debug("voice_clone.chunk", index=idx, text=chunk[:50])
-                pcm = engine.synthesize_clone(
-                    text=chunk,
-                    reference_audio_bytes=ref_audio_bytes_list,
-                    language=language,
-                )
-                audio_chunks.append(pcm)
-
-            # Stitch chunks
-            if len(audio_chunks) > 1:
-                combined_pcm = stitch_audio_chunks(
-                    audio_chunks,
-                    sample_rate=engine.sample_rate,
-                    crossfade_ms=40,
-                )
-            else:
-                combined_pcm = audio_chunks[0]
+            # Encode the reference set once up front; every chunk below
+            # reuses these latents instead of re-running the encoders
+            latents, conditioning_cached = await _prepare_conditioning(ref_audio_bytes_list)
 
-            # Normalize audio
-            normalized_pcm = normalize_audio(combined_pcm)
+            # Submit all chunks to the clone batcher; they decode together
+            # with concurrent clone requests (latents are per reference set)
+            # and each one is stitched in as soon as it is ready
+            pcm_tasks = [
+                asyncio.ensure_future(
+                    clone_batcher.submit(chunk, latents, language)
+                )
+                for chunk in chunks
+            ]
+            normalized_pcm = await _assemble_chunks(
+                pcm_tasks,
+                sample_rate=engine.sample_rate,
+                text_len=len(text),
+                executor=cpu_executor,
+            )
 
             # Wrap in WAV container
             wav_bytes = wrap_wav(
@@ -398,19 +835,14 @@ def create_routes(app: FastAPI, engine: TTSEngine, speaker_cache: SpeakerCache,
                 sample_rate=engine.sample_rate,
             )
 
-            # Calculate duration
-            duration = estimate_duration(
-                normalized_pcm,
-                sample_rate=engine.sample_rate,
-                sample_width=2,
-                channels=1,
-            )
+            # Duration straight from the sample count (mono PCM16)
+            duration = (len(normalized_pcm) // 2) / engine.sample_rate
 
             logger.info(
                 "voice_clone.complete",
                 audio_size=len(wav_bytes),
                 duration_sec=duration,
-                chunks=len(audio_chunks),
+                chunks=len(chunks),
                 ref_audio_count=len(ref_audio_bytes_list),
             )
 
@@ -420,8 +852,9 @@ def create_routes(app: FastAPI, engine: TTSEngine, speaker_cache: SpeakerCache,
                 "X-Duration-Sec": f"{duration:.2f}",
                 "X-Engine": "coqui_xtts",
                 "X-Mode": "voice_clone",
-                "X-Chunks": str(len(audio_chunks)),
+                "X-Chunks": str(len(chunks)),
                 "X-Reference-Count": str(len(ref_audio_bytes_list)),
+                "X-Conditioning-Cached": "hit" if conditioning_cached else "miss",
             }
 
             # Add validation warnings if any
@@ -437,14 +870,95 @@ def create_routes(app: FastAPI, engine: TTSEngine, speaker_cache: SpeakerCache,
         except HTTPException:
             raise
 
+        except TextTooLongError as e:
+            logger.warning("voice_clone.text_too_long", error=str(e))
+            raise _text_too_long(e)
+
         except Exception as e:
             logger.error("voice_clone.failed", error=str(e))
             raise HTTPException(
                 status_code=500,
-                detail=ErrorResponse(
-                    error=ErrorDetail(
-                        code="voice_clone_failed",
-                        message=f"Voice cloning failed: {str(e)}",
+                detail=_err(
+                    "voice_clone_failed",
+                    f"Voice cloning failed: {str(e)}",
+                ),
+            )
+
+    @app.post("/voice-clone/stream")
+    async def voice_clone_stream(
+        text: str = Form(..., min_length=1, max_length=5000),
+        language: str = Form(default="en"),
+        reference_audio: List[UploadFile] = File(...),
+    ):
+        """Stream voice-cloned speech.
+
+        Same form fields as /voice-clone. The reference clips are validated
+        before the response starts; audio is then streamed as a WAV with an
+        open-ended data size while it is generated.
+
+        Returns:
+            Streaming audio/wav response in cloned voice
+        """
+        try:
+            logger.info(
+                "voice_clone_stream.request",
+                language=language,
+                text_len=len(text),
+                ref_audio_count=len(reference_audio),
+            )
+
+            ref_audio_bytes_list, validation_warnings = await _read_reference_audio(
+                reference_audio, "voice_clone_stream"
+            )
+
+            chunks = chunk_text(text, max_chars=200, max_words=60)
+
+            if not chunks:
+                raise HTTPException(status_code=400, detail="Empty text input")
+
+            logger.info("voice_clone_stream.chunking", chunk_count=len(chunks))
+
+            _, conditioning_cached = await _prepare_conditioning(ref_audio_bytes_list)
+
+            def generate_pcm():
+                for chunk in chunks:
+                    yield from engine.synthesize_clone_stream(
+                        text=chunk,
+                        reference_audio_bytes=ref_audio_bytes_list,
+                        language=language,
                     )
-                ).model_dump(),
+
+            headers = {
+                "X-Sample-Rate": str(engine.sample_rate),
+                "X-Engine": "coqui_xtts",
+                "X-Mode": "voice_clone",
+                "X-Chunks": str(len(chunks)),
+                "X-Reference-Count": str(len(ref_audio_bytes_list)),
+                "X-Conditioning-Cached": "hit" if conditioning_cached else "miss",
+            }
+
+            if validation_warnings:
+                headers["X-Validation-Warnings"] = "; ".join(validation_warnings)
+
+            return StreamingResponse(
+                _stream_wav(generate_pcm(), "voice_clone_stream.complete"),
+                media_type="audio/wav",
+                headers=headers,
+            )
+
+        except HTTPException:
+            raise
+
+        except TextTooLongError as e:
+            logger.warning("voice_clone_stream.text_too_long", error=str(e))
+            raise _text_too_long(e)
+
+        except Exception as e:
+            logger.error("voice_clone_stream.failed", error=str(e))
+            raise HTTPException(
+                status_code=500,
+                detail=_err(
+                    "voice_clone_failed",
+                    f"Voice clone streaming failed: {str(e)}",
+                ),
             )
@@ -9,7 +9,9 @@ from shared.audio import (
     generate_silence,
     normalize_audio,
     wrap_wav,
+    wav_header_streaming,
     estimate_duration,
+    PCMAssembler,
     AudioValidationResult,
     validate_audio_duration,
     validate_audio_quality,
@@ -23,7 +25,9 @@ __all__ = [
     "generate_silence",
     "normalize_audio",
     "wrap_wav",
+    "wav_header_streaming",
     "estimate_duration",
+    "PCMAssembler",
     "AudioValidationResult",
     "validate_audio_duration",
     "validate_audio_quality",
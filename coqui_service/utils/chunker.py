@@ -5,13 +5,16 @@ Simplified to focus on sentence-boundary chunking for Coqui XTTS.
 """
 
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
 
 
 def split_sentences(text: str) -> List[str]:
     """Split text into sentences using common punctuation."""
-    parts = re.split(r"(?<=[.!?])\s+", text.strip())
-    return [part.strip() for part in parts if part.strip()]
+    parts = (part.strip() for part in _SENTENCE_SPLIT.split(text.strip()))
+    return [part for part in parts if part]
 
 
 def chunk_text(
@@ -36,9 +39,25 @@ def chunk_text(
     Note:
         XTTS v2 warns at 250 chars, so we default to 200 for safety.
     """
+    # Repeated inputs (UI strings, smoke tests) skip re-chunking; the cache
+    # holds tuples so callers can't mutate a shared result
+    return list(
+        _chunk_text_cached(text, max_chars, max_words, min_chars, preserve_sentence_boundaries)
+    )
+
+
+@lru_cache(maxsize=256)
+def _chunk_text_cached(
+    text: str,
+    max_chars: int,
+    max_words: int,
+    min_chars: int,
+    preserve_sentence_boundaries: bool,
+) -> Tuple[str, ...]:
+    """Memoized body of chunk_text."""
     cleaned = text.strip()
     if not cleaned:
-        return []
+        return ()
 
     # Split into sentences if requested
     sentences = split_sentences(cleaned) if preserve_sentence_boundaries else [cleaned]
@@ -91,4 +110,4 @@ def chunk_text(
         chunks[-2] = f"{chunks[-2]} {chunks[-1]}".strip()
         chunks.pop()
 
-    return chunks
+    return tuple(chunks)
@@ -0,0 +1,184 @@
+"""Content-addressed cache of synthesized /tts audio.
+
+TTS traffic repeats a lot (UI strings, notifications, demos), so finished WAV
+bytes are kept in an in-memory LRU keyed by a BLAKE2b digest of everything
+that determines the output, with a second tier of .wav files on the Modal
+Volume so other containers (and restarts) can reuse them. The Volume tier is
+capped by file count; the oldest-written files are swept out past the cap.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Volume-tier sweep runs once per this many persisted results
+_SWEEP_EVERY = 64
+# Temp files older than this are leftovers from an interrupted write
+_STALE_TMP_SECONDS = 3600
+
+
+class TTSResultCache:
+    """Two-tier (memory LRU + Volume files) cache of WAV bytes."""
+
+    def __init__(
+        self,
+        volume_path: str = "/models/coqui",
+        max_entries: int = 512,
+        max_files: int = 4096,
+    ):
+        self.cache_dir = Path(volume_path) / "tts_cache"
+        self.max_entries = max_entries
+        self.max_files = max_files
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        # load()/persist()/clear() run on executor threads while get()/put()
+        # run on the event loop
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    @staticmethod
+    def make_key(text: str, speaker_id: str, language: str, sample_rate: int) -> str:
+        """Digest of the inputs that determine the synthesized audio."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (speaker_id, language, str(sample_rate), text):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached WAV bytes from memory, or None."""
+        with self._lock:
+            wav_bytes = self._entries.get(key)
+            if wav_bytes is not None:
+                self._entries.move_to_end(key)
+        return wav_bytes
+
+    def load(self, key: str) -> Optional[bytes]:
+        """Read WAV bytes from the Volume tier (blocking), promoting hits to memory."""
+        path = self.cache_dir / f"{key}.wav"
+        try:
+            wav_bytes = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("tts_cache.read_error", key=key, error=str(e))
+            return None
+
+        self.put(key, wav_bytes)
+        return wav_bytes
+
+    def put(self, key: str, wav_bytes: bytes) -> None:
+        """Store WAV bytes in the memory tier, evicting the oldest entry."""
+        with self._lock:
+            self._entries[key] = wav_bytes
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def persist(self, key: str, wav_bytes: bytes) -> None:
+        """Write WAV bytes to the Volume tier (blocking).
+
+        Written via a uniquely named temp file + rename so concurrent readers
+        never see a partial file and concurrent writers never share one. Left
+        to the Volume's background commit rather than committing per result.
+        """
+        path = self.cache_dir / f"{key}.wav"
+        tmp_name = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_name = tmp.name
+                tmp.write(wav_bytes)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.warning("tts_cache.write_error", key=key, error=str(e))
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+            return
+
+        with self._lock:
+            self._writes += 1
+            sweep = self._writes % _SWEEP_EVERY == 0
+        if sweep:
+            self.sweep()
+
+    def sweep(self) -> int:
+        """Trim the Volume tier to max_files (blocking). Returns files removed.
+
+        The oldest-written results go first; temp files abandoned by an
+        interrupted write are removed as well.
+        """
+        now = time.time()
+        results = []
+        removed = 0
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    if entry.name.endswith(".wav"):
+                        results.append((mtime, entry.path))
+                    elif entry.name.endswith(".tmp") and now - mtime > _STALE_TMP_SECONDS:
+                        try:
+                            os.unlink(entry.path)
+                            removed += 1
+                        except OSError:
+                            pass
+        except OSError as e:
+            logger.warning("tts_cache.sweep_error", error=str(e))
+            return removed
+
+        excess = len(results) - self.max_files
+        if excess > 0:
+            results.sort()
+            for _, path in results[:excess]:
+                try:
+                    os.unlink(path)
+                    removed += 1
+                except OSError as e:
+                    logger.warning("tts_cache.delete_error", path=path, error=str(e))
+
+        if removed:
+            logger.info(
+                "tts_cache.swept",
+                files_removed=removed,
+                files_kept=len(results) - max(excess, 0),
+            )
+        return removed
+
+    def clear(self, volume) -> int:
+        """Drop both tiers (blocking). Returns the number of files removed.
+
+        Args:
+            volume: Modal Volume instance (for commit)
+        """
+        with self._lock:
+            self._entries.clear()
+
+        removed = 0
+        if self.cache_dir.exists():
+            for path in self.cache_dir.iterdir():
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.warning("tts_cache.delete_error", path=str(path), error=str(e))
+            volume.commit()
+
+        logger.info("tts_cache.cleared", files_removed=removed)
+        return removed
@@ -5,12 +5,27 @@ and audio validation for both reference and source audio.
 """
 
 import io
-import wave
-import tempfile
+import os
 import struct
-from array import array
-from typing import List, Tuple, Optional
+import wave
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+    from numba import types as nb_types
+except ImportError:  # optional: services without numba use the NumPy path
+    njit = None
+
+# Kernels are picked once, here, so calls pay no dispatch cost. Numba targets
+# the host CPU, so the compiled loops use whatever SIMD width it offers
+# (AVX-512/AVX2/NEON); AUDIO_JIT=0 forces the NumPy path for benchmarking
+# or as a rollback switch.
+if os.environ.get("AUDIO_JIT", "1") == "0":
+    njit = None
 
 
 def stitch_audio_chunks(
@@ -40,19 +55,103 @@ def stitch_audio_chunks(
     if len(chunks) == 1:
         return chunks[0]
 
-    combined = chunks[0]
-    silence = generate_silence(silence_ms, sample_rate, sample_width, channels)
+    if crossfade_ms <= 0 or sample_width != 2:  # Only support 16-bit crossfade
+        return generate_silence(silence_ms, sample_rate, sample_width, channels).join(chunks)
+
+    # Silence is never materialized: its slots in the output are zero-filled
+    fade_samples = int(sample_rate * (crossfade_ms / 1000)) * channels
+    silence_samples = _silence_frames(silence_ms, sample_rate) * channels
+    arrays = [np.frombuffer(chunk, dtype=np.int16) for chunk in chunks]
+
+    # Size the output up front so every chunk is written exactly once
+    fades = []
+    total = len(arrays[0])
+    for samples in arrays[1:]:
+        fade = min(fade_samples, total, len(samples))
+        fades.append(fade)
+        total += len(samples) - fade + silence_samples
+
+    output = np.empty(total, dtype=np.int16)
+    pos = len(arrays[0])
+    output[:pos] = arrays[0]
+
+    for samples, fade in zip(arrays[1:], fades):
+        _crossfade_into(output, pos - fade, samples[:fade])
+        end = pos + len(samples) - fade
+        output[pos:end] = samples[fade:]
+        pos = end
+        if silence_samples:
+            output[pos:pos + silence_samples] = 0
+            pos += silence_samples
+
+    return output.tobytes()
+
+
+if njit is not None:
 
-    for chunk in chunks[1:]:
-        if crossfade_ms > 0 and sample_width == 2:  # Only support 16-bit crossfade
-            fade_samples = int(sample_rate * (crossfade_ms / 1000)) * channels
-            combined = crossfade_pcm16(combined, chunk, fade_samples=fade_samples)
-            if silence:
-                combined += silence
-        else:
-            combined = combined + silence + chunk
+    # Explicit signatures: compiled (or loaded from cache) at import, so the
+    # first request doesn't pay the JIT. np.frombuffer over bytes gives
+    # read-only arrays, hence the second variant for ``right``.
+    _PCM16 = nb_types.Array(nb_types.int16, 1, "A")
+    _PCM16_RO = nb_types.Array(nb_types.int16, 1, "A", readonly=True)
+
+    @njit(
+        [
+            nb_types.void(_PCM16, nb_types.int64, _PCM16),
+            nb_types.void(_PCM16, nb_types.int64, _PCM16_RO),
+        ],
+        cache=True,
+        nogil=True,
+        boundscheck=False,
+    )
+    def _crossfade_kernel(buffer, start, right):
+        """Scalar crossfade loop compiled to native code (no float temporaries).
 
-    return combined
+        Same float64 expression and truncation as the NumPy path, so both
+        produce identical samples; fastmath is off to keep it that way.
+        """
+        fade = right.shape[0]
+        for i in range(fade):
+            mixed = buffer[start + i] * ((fade - i) / fade) + right[i] * (i / fade)
+            buffer[start + i] = np.int16(min(max(int(mixed), -32768), 32767))
+
+else:
+    _crossfade_kernel = None
+
+
+@lru_cache(maxsize=32)
+def _fade_ramps(fade: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Fade-out/fade-in gain ramps for a fade length (shared, read-only).
+
+    Stitching uses one fade length per (sample_rate, crossfade_ms), so the
+    ramps are built once instead of per chunk.
+    """
+    idx = np.arange(fade)
+    fade_out = (fade - idx) / fade
+    fade_in = idx / fade
+    fade_out.flags.writeable = False
+    fade_in.flags.writeable = False
+    return fade_out, fade_in
+
+
+def _crossfade_into(buffer: np.ndarray, start: int, right: np.ndarray) -> None:
+    """Crossfade ``right`` into ``buffer[start:start + len(right)]`` in place.
+
+    Linear fade-out/fade-in: left * (fade - i) / fade + right * i / fade,
+    truncated toward zero and clamped to int16.
+    """
+    fade = len(right)
+    if fade == 0:
+        return
+
+    if _crossfade_kernel is not None:
+        _crossfade_kernel(buffer, start, right)
+        return
+
+    fade_out, fade_in = _fade_ramps(fade)
+    left = buffer[start:start + fade].astype(np.float64)
+    mixed = left * fade_out + right.astype(np.float64) * fade_in
+    buffer[start:start + fade] = np.clip(np.trunc(mixed), -32768, 32767)
 
 
 def crossfade_pcm16(left: bytes, right: bytes, fade_samples: int) -> bytes:
@@ -69,31 +168,19 @@ def crossfade_pcm16(left: bytes, right: bytes, fade_samples: int) -> bytes:
     if fade_samples <= 0:
         return left + right
 
-    left_samples = array("h")
-    right_samples = array("h")
-    left_samples.frombytes(left)
-    right_samples.frombytes(right)
+    left_samples = np.frombuffer(left, dtype=np.int16)
+    right_samples = np.frombuffer(right, dtype=np.int16)
 
     # Adjust fade if chunks are too short
     fade_samples = min(fade_samples, len(left_samples), len(right_samples))
     if fade_samples == 0:
         return left + right
 
-    output = array("h")
-    output.extend(left_samples[:-fade_samples])
-
-    # Crossfade region
-    for idx in range(fade_samples):
-        left_sample = left_samples[-fade_samples + idx]
-        right_sample = right_samples[idx]
-        left_gain = (fade_samples - idx) / fade_samples
-        right_gain = idx / fade_samples
-        mixed = int(left_sample * left_gain + right_sample * right_gain)
-        # Clamp to 16-bit range
-        mixed = max(-32768, min(32767, mixed))
-        output.append(mixed)
-
-    output.extend(right_samples[fade_samples:])
+    # Copy the left chunk once, mix the overlap in place, append the rest
+    output = np.empty(len(left_samples) + len(right_samples) - fade_samples, dtype=np.int16)
+    output[:len(left_samples)] = left_samples
+    _crossfade_into(output, len(left_samples) - fade_samples, right_samples[:fade_samples])
+    output[len(left_samples):] = right_samples[fade_samples:]
     return output.tobytes()
 
 
@@ -114,12 +201,15 @@ def generate_silence(
     Returns:
         Silent PCM audio bytes
     """
-    if duration_ms <= 0:
-        return b""
+    total_samples = _silence_frames(duration_ms, sample_rate) * channels
+    return bytes(total_samples * sample_width)
 
-    total_frames = int(sample_rate * (duration_ms / 1000))
-    total_samples = total_frames * channels
-    return b"\x00" * (total_samples * sample_width)
+
+def _silence_frames(duration_ms: int, sample_rate: int) -> int:
+    """Number of frames in duration_ms of silence (0 for non-positive durations)."""
+    if duration_ms <= 0:
+        return 0
+    return int(sample_rate * (duration_ms / 1000))
 
 
 def normalize_audio(
@@ -142,31 +232,65 @@ def normalize_audio(
     if not audio or sample_width != 2:  # Only support 16-bit
         return audio
 
-    samples = array("h")
-    samples.frombytes(audio)
+    samples = np.frombuffer(audio, dtype=np.int16)
 
-    if not samples:
+    if not samples.size:
         return audio
 
-    # Find peak
-    peak = max(abs(sample) for sample in samples)
+    # Find peak (min/max reduce in int16; abs() would need a widened copy)
+    peak = max(int(samples.max()), -int(samples.min()))
     if peak == 0:
         return audio
 
-    # Calculate scale factor
-    scale = (target_peak * 32767) / peak
+    return _apply_gain_q15(samples.copy(), _gain_q15(peak, target_peak)).tobytes()
+
 
-    # Apply normalization
-    for idx, sample in enumerate(samples):
-        scaled = int(sample * scale)
-        # Clamp to 16-bit range
-        samples[idx] = max(-32768, min(32767, scaled))
+def _gain_q15(peak: int, target_peak: float) -> int:
+    """Fixed-point (Q15) gain that maps peak onto target_peak full scale."""
+    return int((target_peak * 32767) * (1 << 15) / peak)
 
-    return samples.tobytes()
+
+if njit is not None:
+
+    @njit(
+        nb_types.void(nb_types.Array(nb_types.int16, 1, "A"), nb_types.int64),
+        cache=True,
+        nogil=True,
+        boundscheck=False,
+    )
+    def _scale_kernel(samples, gain):
+        """Q15 multiply/shift/saturate loop; LLVM vectorizes it to SIMD lanes."""
+        g = np.int32(gain)
+        for i in range(samples.shape[0]):
+            scaled = (np.int32(samples[i]) * g) >> 15
+            samples[i] = np.int16(min(max(scaled, -32768), 32767))
+
+else:
+    _scale_kernel = None
+
+
+def _apply_gain_q15(samples: np.ndarray, gain: int, block: int = 1 << 16) -> np.ndarray:
+    """Scale int16 samples in place by a Q15 gain and return them.
+
+    Works in int32 blocks: |sample| <= peak, so sample * gain stays within
+    target_peak * 2**30 and the shifted result fits int16 without clipping
+    for target_peak <= 1.0. Higher targets are saturated.
+    """
+    if _scale_kernel is not None:
+        _scale_kernel(samples, gain)
+        return samples
+
+    for start in range(0, len(samples), block):
+        scaled = samples[start:start + block].astype(np.int32)
+        scaled *= gain
+        scaled >>= 15
+        np.clip(scaled, -32768, 32767, out=scaled)
+        samples[start:start + block] = scaled
+    return samples
 
 
 def wrap_wav(
-    audio_pcm: bytes,
+    audio_pcm: Union[bytes, memoryview],
     sample_rate: int = 22050,
     sample_width: int = 2,
     channels: int = 1,
@@ -174,7 +298,7 @@ def wrap_wav(
     """Wrap raw PCM bytes into a WAV container.
 
     Args:
-        audio_pcm: Raw PCM audio bytes
+        audio_pcm: Raw PCM audio bytes (or a byte view of them)
         sample_rate: Sample rate in Hz
         sample_width: Bytes per sample
         channels: Number of channels
@@ -182,13 +306,56 @@ def wrap_wav(
     Returns:
         WAV file bytes
     """
-    buffer = io.BytesIO()
-    with wave.open(buffer, "wb") as wav_file:
-        wav_file.setnchannels(channels)
-        wav_file.setsampwidth(sample_width)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(audio_pcm)
-    return buffer.getvalue()
+    # Sizes are known up front, so emit the header once and copy the PCM a
+    # single time (the wave module seeks back to patch sizes and copies twice)
+    header = wav_header_streaming(
+        sample_rate=sample_rate,
+        sample_width=sample_width,
+        channels=channels,
+        data_size=memoryview(audio_pcm).nbytes,
+    )
+    return b"".join((header, audio_pcm))
+
+
+def wav_header_streaming(
+    sample_rate: int = 22050,
+    sample_width: int = 2,
+    channels: int = 1,
+    data_size: int = 0xFFFFFFFF,
+) -> bytes:
+    """Build a WAV header for audio whose total length is not known yet.
+
+    The RIFF and data chunk sizes default to 0xFFFFFFFF ("unknown"), which
+    players and decoders treat as "read until EOF", so the header can be sent
+    before the first PCM chunk of a streamed response.
+
+    Args:
+        sample_rate: Sample rate in Hz
+        sample_width: Bytes per sample
+        channels: Number of channels
+        data_size: Size of the PCM payload in bytes, if known
+
+    Returns:
+        44-byte WAV header
+    """
+    block_align = channels * sample_width
+    riff_size = 0xFFFFFFFF if data_size == 0xFFFFFFFF else 36 + data_size
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        riff_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        sample_width * 8,
+        b"data",
+        data_size,
+    )
 
 
 def estimate_duration(
@@ -215,6 +382,75 @@ def estimate_duration(
     return frames / sample_rate
 
 
+class PCMAssembler:
+    """Incrementally stitch mono PCM16 chunks into one growing buffer.
+
+    Chunks can be appended as they are produced; each one is crossfaded
+    in place against the tail of the audio so far (same curve as
+    ``crossfade_pcm16``), and the peak is tracked as samples become final,
+    so ``finish`` only has to apply a single gain. The result matches
+    ``normalize_audio(stitch_audio_chunks(chunks, ...))``.
+    """
+
+    def __init__(self, sample_rate: int, crossfade_ms: int = 40, expected_samples: int = 0):
+        self.fade_samples = int(sample_rate * (crossfade_ms / 1000))
+        self._buffer = np.empty(max(expected_samples, 1024), dtype=np.int16)
+        self._length = 0
+        self._peak = 0
+        self._peak_upto = 0  # samples before this index can no longer change
+
+    def append(self, pcm: bytes) -> None:
+        """Crossfade-append one PCM16 chunk."""
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        fade = min(self.fade_samples, self._length, len(samples))
+        start = self._length - fade
+        end = start + len(samples)
+        self._reserve(end)
+
+        _crossfade_into(self._buffer, start, samples[:fade])
+        self._buffer[self._length:end] = samples[fade:]
+        self._length = end
+
+        # The last fade_samples may still be crossfaded by the next chunk
+        self._update_peak(max(self._length - self.fade_samples, self._peak_upto))
+
+    def finish(self, target_peak: float = 0.95) -> bytes:
+        """Return the stitched audio, peak-normalized to target_peak.
+
+        The gain is applied in place (Q15 fixed point, block by block), so
+        no full-length temporary is allocated; the assembler is spent
+        afterwards.
+        """
+        return self.finish_view(target_peak).tobytes()
+
+    def finish_view(self, target_peak: float = 0.95) -> memoryview:
+        """Like ``finish``, but return a read-only byte view of the buffer.
+
+        Lets the caller hand the PCM straight to ``wrap_wav`` without first
+        materializing it as bytes.
+        """
+        self._update_peak(self._length)
+        samples = self._buffer[:self._length]
+        if self._peak != 0:
+            _apply_gain_q15(samples, _gain_q15(self._peak, target_peak))
+
+        return memoryview(samples).cast("B").toreadonly()
+
+    def _update_peak(self, upto: int) -> None:
+        if upto > self._peak_upto:
+            region = self._buffer[self._peak_upto:upto]
+            # min/max reduce in int16 directly; abs() would need a widened copy
+            peak = max(int(region.max()), -int(region.min()))
+            self._peak = max(self._peak, peak)
+            self._peak_upto = upto
+
+    def _reserve(self, size: int) -> None:
+        if size > len(self._buffer):
+            grown = np.empty(max(size, 2 * len(self._buffer)), dtype=np.int16)
+            grown[:self._length] = self._buffer[:self._length]
+            self._buffer = grown
+
+
 # ============================================================================
 # Audio Validation Utilities
 # ============================================================================
@@ -231,6 +467,132 @@ class AudioValidationResult:
     warning_message: Optional[str] = None
 
 
+def _parse_wav_header(audio_bytes: bytes) -> Optional[Tuple[int, int, int, int]]:
+    """Read (sample_rate, channels, sample_width, frames) from a canonical header.
+
+    Only handles the plain 44-byte PCM layout (fmt chunk first, data chunk
+    right after it). Returns None for anything else so the caller can fall
+    back to the wave module.
+    """
+    if len(audio_bytes) < 44:
+        return None
+
+    (riff, _, wave_id, fmt_id, fmt_size, audio_format, channels, sample_rate,
+     _, _, bits, data_id, data_size) = struct.unpack_from("<4sI4s4sIHHIIHH4sI", audio_bytes)
+    if (
+        riff != b"RIFF" or wave_id != b"WAVE" or fmt_id != b"fmt " or data_id != b"data"
+        or fmt_size != 16 or audio_format != 1 or not channels or not sample_rate or not bits
+    ):
+        return None
+
+    sample_width = (bits + 7) // 8
+    return sample_rate, channels, sample_width, data_size // (channels * sample_width)
+
+
+def _read_wav_params(audio_bytes: bytes) -> Tuple[int, int, int, int]:
+    """(sample_rate, channels, sample_width, frames) of a WAV file in memory.
+
+    Raises:
+        wave.Error: If the bytes are not a readable WAV file
+    """
+    params = _parse_wav_header(audio_bytes)
+    if params is not None:
+        return params
+
+    # Reject non-WAV uploads on the magic bytes alone (same errors the wave
+    # module would raise, without building a reader)
+    if len(audio_bytes) >= 4 and audio_bytes[:4] != b"RIFF":
+        raise wave.Error("file does not start with RIFF id")
+    if len(audio_bytes) >= 8 and audio_bytes[8:12] != b"WAVE":
+        raise wave.Error("not a WAVE file")
+
+    with wave.open(io.BytesIO(audio_bytes), 'rb') as wav:
+        return wav.getframerate(), wav.getnchannels(), wav.getsampwidth(), wav.getnframes()
+
+
+def _check_duration(
+    params: Tuple[int, int, int, int],
+    min_duration: float,
+    max_duration: float,
+    optimal_min: float,
+    optimal_max: float,
+) -> AudioValidationResult:
+    """Duration checks for voice cloning on already-parsed WAV params."""
+    rate, channels, _, frames = params
+    duration = frames / float(rate)
+
+    # Check minimum duration
+    if duration < min_duration:
+        return AudioValidationResult(
+            is_valid=False,
+            duration=duration,
+            sample_rate=rate,
+            channels=channels,
+            error_message=f"Audio too short ({duration:.1f}s). Minimum: {min_duration}s for voice cloning",
+        )
+
+    # Check maximum duration
+    if duration > max_duration:
+        return AudioValidationResult(
+            is_valid=False,
+            duration=duration,
+            sample_rate=rate,
+            channels=channels,
+            error_message=f"Audio too long ({duration:.1f}s). Maximum: {max_duration}s",
+        )
+
+    # Check if within optimal range
+    warning = None
+    if duration < optimal_min or duration > optimal_max:
+        warning = f"Audio duration ({duration:.1f}s) is acceptable but {optimal_min}-{optimal_max}s is optimal for best quality"
+
+    return AudioValidationResult(
+        is_valid=True,
+        duration=duration,
+        sample_rate=rate,
+        channels=channels,
+        warning_message=warning,
+    )
+
+
+def _check_quality(
+    params: Tuple[int, int, int, int],
+    min_sample_rate: int,
+    preferred_sample_rate: int,
+) -> AudioValidationResult:
+    """Sample rate / channel / bit depth checks on already-parsed WAV params."""
+    sample_rate, channels, sample_width, _ = params
+
+    # Check sample rate
+    if sample_rate < min_sample_rate:
+        return AudioValidationResult(
+            is_valid=False,
+            sample_rate=sample_rate,
+            channels=channels,
+            error_message=f"Sample rate too low ({sample_rate}Hz). Minimum: {min_sample_rate}Hz",
+        )
+
+    # Generate warnings for non-optimal settings
+    warnings = []
+    if sample_rate < preferred_sample_rate:
+        warnings.append(f"Sample rate {sample_rate}Hz is below optimal {preferred_sample_rate}Hz")
+
+    if channels > 1:
+        warnings.append(f"Audio is {channels}-channel (stereo). Mono is preferred for voice cloning")
+
+    if sample_width < 2:
+        warnings.append(f"Audio is {sample_width*8}-bit. 16-bit or higher recommended")
+
+    warning_msg = "; ".join(warnings) if warnings else None
+
+    return AudioValidationResult(
+        is_valid=True,
+        sample_rate=sample_rate,
+        channels=channels,
+        warning_message=warning_msg,
+    )
+
+
 def validate_audio_duration(
     audio_bytes: bytes,
     min_duration: float = 3.0,
@@ -251,56 +613,15 @@ def validate_audio_duration(
         AudioValidationResult with duration info and validation status
     """
     try:
-        # Write to temp file and analyze with wave module
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=True) as f:
-            f.write(audio_bytes)
-            f.flush()
-
-            try:
-                with wave.open(f.name, 'rb') as wav:
-                    frames = wav.getnframes()
-                    rate = wav.getframerate()
-                    channels = wav.getnchannels()
-                    duration = frames / float(rate)
-
-                    # Check minimum duration
-                    if duration < min_duration:
-                        return AudioValidationResult(
-                            is_valid=False,
-                            duration=duration,
-                            sample_rate=rate,
-                            channels=channels,
-                            error_message=f"Audio too short ({duration:.1f}s). Minimum: {min_duration}s for voice cloning",
-                        )
-
-                    # Check maximum duration
-                    if duration > max_duration:
-                        return AudioValidationResult(
-                            is_valid=False,
-                            duration=duration,
-                            sample_rate=rate,
-                            channels=channels,
-                            error_message=f"Audio too long ({duration:.1f}s). Maximum: {max_duration}s",
-                        )
-
-                    # Check if within optimal range
-                    warning = None
-                    if duration < optimal_min or duration > optimal_max:
-                        warning = f"Audio duration ({duration:.1f}s) is acceptable but {optimal_min}-{optimal_max}s is optimal for best quality"
-
-                    return AudioValidationResult(
-                        is_valid=True,
-                        duration=duration,
-                        sample_rate=rate,
-                        channels=channels,
-                        warning_message=warning,
-                    )
-
-            except wave.Error as e:
-                return AudioValidationResult(
-                    is_valid=False,
-                    error_message=f"Invalid WAV file: {str(e)}",
-                )
+        try:
+            params = _read_wav_params(audio_bytes)
+        except wave.Error as e:
+            return AudioValidationResult(
+                is_valid=False,
+                error_message=f"Invalid WAV file: {str(e)}",
+            )
+
+        return _check_duration(params, min_duration, max_duration, optimal_min, optimal_max)
 
     except Exception as e:
         return AudioValidationResult(
@@ -325,50 +646,15 @@ def validate_audio_quality(
         AudioValidationResult with quality info
     """
     try:
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=True) as f:
-            f.write(audio_bytes)
-            f.flush()
-
-            try:
-                with wave.open(f.name, 'rb') as wav:
-                    sample_rate = wav.getframerate()
-                    channels = wav.getnchannels()
-                    sample_width = wav.getsampwidth()
-
-                    # Check sample rate
-                    if sample_rate < min_sample_rate:
-                        return AudioValidationResult(
-                            is_valid=False,
-                            sample_rate=sample_rate,
-                            channels=channels,
-                            error_message=f"Sample rate too low ({sample_rate}Hz). Minimum: {min_sample_rate}Hz",
-                        )
-
-                    # Generate warnings for non-optimal settings
-                    warnings = []
-                    if sample_rate < preferred_sample_rate:
-                        warnings.append(f"Sample rate {sample_rate}Hz is below optimal {preferred_sample_rate}Hz")
-
-                    if channels > 1:
-                        warnings.append(f"Audio is {channels}-channel (stereo). Mono is preferred for voice cloning")
-
-                    if sample_width < 2:
-                        warnings.append(f"Audio is {sample_width*8}-bit. 16-bit or higher recommended")
-
-                    warning_msg = "; ".join(warnings) if warnings else None
-
-                    return AudioValidationResult(
-                        is_valid=True,
-                        sample_rate=sample_rate,
-                        channels=channels,
-                        warning_message=warning_msg,
-                    )
-
-            except wave.Error as e:
-                return AudioValidationResult(
-                    is_valid=False,
-                    error_message=f"Invalid WAV file: {str(e)}",
-                )
+        try:
+            params = _read_wav_params(audio_bytes)
+        except wave.Error as e:
+            return AudioValidationResult(
+                is_valid=False,
+                error_message=f"Invalid WAV file: {str(e)}",
+            )
+
+        return _check_quality(params, min_sample_rate, preferred_sample_rate)
 
     except Exception as e:
         return AudioValidationResult(
@@ -398,13 +684,28 @@ def validate_reference_audio(
             error_message=f"File too large ({size_mb:.1f}MB). Maximum: {max_size_mb}MB",
         )
 
-    # Validate duration
-    duration_result = validate_audio_duration(audio_bytes)
+    # Parse the header once and run both checks on it
+    try:
+        try:
+            params = _read_wav_params(audio_bytes)
+        except wave.Error as e:
+            return AudioValidationResult(
+                is_valid=False,
+                error_message=f"Invalid WAV file: {str(e)}",
+            )
+
+        # Validate duration
+        duration_result = _check_duration(params, 3.0, 30.0, 6.0, 10.0)
+    except Exception as e:
+        return AudioValidationResult(
+            is_valid=False,
+            error_message=f"Audio validation failed: {str(e)}",
+        )
     if not duration_result.is_valid:
         return duration_result
 
     # Validate quality
-    quality_result = validate_audio_quality(audio_bytes)
+    quality_result = _check_quality(params, 16000, 22050)
     if not quality_result.is_valid:
         return quality_result
 
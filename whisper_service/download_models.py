@@ -2,14 +2,18 @@
 
 This script should be run once to download the required models to the Modal Volume:
 - WhisperX large-v3-turbo model (~3GB)
-- Wav2Vec2 alignment model (~1.2GB)
+- Wav2Vec2 alignment models: English (~1.2GB) plus the languages the engine
+  preloads at startup (WHISPERX_ALIGN_PRELOAD)
 - VAD (Voice Activity Detection) model (~300MB)
 
 Usage:
     modal run whisper_service/download_models.py
 """
 
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import modal
 
 # Create Modal app for model download
@@ -27,6 +31,8 @@ image = (
     .run_commands("apt-get update && apt-get install -y ffmpeg git")
     # Install WhisperX from official GitHub repo (fixes yanked PyPI version issue)
     .pip_install("git+https://github.com/m-bain/whisperX.git@v3.7.6")
+    # For the engine's alignment preload list
+    .add_local_python_source("whisper_service")
 )
 
 
@@ -41,7 +47,8 @@ def download_whisperx_models():
 
     Downloads:
     1. WhisperX large-v3-turbo model (~3GB)
-    2. Wav2Vec2 alignment model for English (~1.2GB)
+    2. Wav2Vec2 alignment models for English (~1.2GB) and the engine's
+       preload languages (WHISPERX_ALIGN_PRELOAD)
     3. VAD model (~300MB)
 
     Note: Modal automatically commits volume changes in background (2025 update).
@@ -50,6 +57,8 @@ def download_whisperx_models():
     import structlog
     import torch
 
+    from whisper_service.engine import DEFAULT_ALIGN_PRELOAD
+
     # Workaround for PyTorch 2.8+ weights_only security
     # PyTorch 2.6+ changed default from weights_only=False to True
     # pyannote/whisperx models use omegaconf in checkpoints, which isn't whitelisted
@@ -60,24 +69,47 @@ def download_whisperx_models():
         """Patched torch.load that forces weights_only=False for trusted models."""
         # Force False even if explicitly passed by libraries (lightning_fabric, etc.)
         kwargs['weights_only'] = False
+        # Checkpoints on the Volume (including the pyannote VAD, which lightning
+        # hands over as an open file) are read in one large buffered read: mmap
+        # or torch's own reads turn into many small network round trips there
+        f = args[0] if args else kwargs.get('f')
+        path = f if isinstance(f, (str, os.PathLike)) else getattr(f, 'name', None)
+        if (
+            isinstance(path, (str, os.PathLike))
+            and os.fspath(path).startswith("/models")
+            and os.path.isfile(path)
+        ):
+            with open(path, 'rb') as checkpoint:
+                buffer = io.BytesIO(checkpoint.read())
+            rest = {k: v for k, v in kwargs.items() if k not in ('f', 'mmap')}
+            return _original_torch_load(buffer, *args[1:], **rest)
         return _original_torch_load(*args, **kwargs)
 
     # Apply monkey patch globally
     torch.load = _patched_torch_load
 
-    import whisperx
-
     logger = structlog.get_logger()
 
-    # Set cache directories to Volume paths
+    # Set cache directories to Volume paths (before importing whisperx, so
+    # transformers sees them at import time)
     # HuggingFace hub cache (for alignment models)
     os.environ["HF_HUB_CACHE"] = "/models/hf_cache"
     os.environ["HF_HOME"] = "/models/hf_cache"
     # Torch cache
     os.environ["TORCH_HOME"] = "/models/torch_cache"
+    # Parallel safetensors shard loading (transformers-backed alignment models)
+    os.environ.setdefault("HF_ENABLE_PARALLEL_LOADING", "true")
+    os.environ.setdefault("HF_PARALLEL_LOADING_WORKERS", "8")
+
+    import whisperx
 
     device = "cuda" if torch.cuda.is_available() else "cpu"
-    compute_type = "float16" if device == "cuda" else "int8"
+    # Must match the engine's choice (WHISPERX_COMPUTE_TYPE) so the same load
+    # path is exercised
+    compute_type = os.environ.get(
+        "WHISPERX_COMPUTE_TYPE",
+        "int8_float16" if device == "cuda" else "int8",
+    )
 
     logger.info(
         "model_download.start",
@@ -88,43 +120,62 @@ def download_whisperx_models():
     # ========================================================================
     # 1. Download WhisperX large-v3-turbo model
     # ========================================================================
-    logger.info("model_download.whisperx.start", model="large-v3-turbo")
-
-    try:
-        # WhisperX will download to HF_HOME
-        model = whisperx.load_model(
-            "large-v3-turbo",
-            device=device,
-            compute_type=compute_type,
-        )
-        logger.info(
-            "model_download.whisperx.complete",
-            model="large-v3-turbo",
-            device=device,
-        )
-    except Exception as e:
-        logger.error("model_download.whisperx.failed", error=str(e))
-        raise
+    def _download_whisper():
+        logger.info("model_download.whisperx.start", model="large-v3-turbo")
+
+        try:
+            # WhisperX will download to HF_HOME
+            whisperx.load_model(
+                "large-v3-turbo",
+                device=device,
+                compute_type=compute_type,
+            )
+            logger.info(
+                "model_download.whisperx.complete",
+                model="large-v3-turbo",
+                device=device,
+            )
+        except Exception as e:
+            logger.error("model_download.whisperx.failed", error=str(e))
+            raise
 
     # ========================================================================
-    # 2. Download Wav2Vec2 alignment model (English)
+    # 2. Download Wav2Vec2 alignment models (English + engine preload list)
     # ========================================================================
-    logger.info("model_download.alignment.start", language="en")
-
-    try:
-        # Load alignment model for English (downloads from HuggingFace)
-        alignment_model, metadata = whisperx.load_align_model(
-            language_code="en",
-            device=device,
-        )
-        logger.info(
-            "model_download.alignment.complete",
-            language="en",
-            metadata=metadata,
-        )
-    except Exception as e:
-        logger.error("model_download.alignment.failed", error=str(e))
-        raise
+    # Same list the engine loads at startup, so none of those fall back to a
+    # download on a cold start
+    align_languages = ["en"]
+    for code in os.environ.get("WHISPERX_ALIGN_PRELOAD", DEFAULT_ALIGN_PRELOAD).split(","):
+        code = code.strip()
+        if code and code not in align_languages:
+            align_languages.append(code)
+
+    def _download_alignment(language):
+        logger.info("model_download.alignment.start", language=language)
+
+        try:
+            # Downloads from HuggingFace (or torchaudio's bundles into TORCH_HOME)
+            _, metadata = whisperx.load_align_model(
+                language_code=language,
+                device=device,
+            )
+            logger.info(
+                "model_download.alignment.complete",
+                language=language,
+                metadata=metadata,
+            )
+        except Exception as e:
+            logger.error("model_download.alignment.failed", language=language, error=str(e))
+            raise
+
+    # All transfers run at once so the link isn't idle while the smaller
+    # ones would otherwise wait; the patched torch.load above is already
+    # installed for every thread
+    with ThreadPoolExecutor(max_workers=1 + len(align_languages)) as pool:
+        downloads = [pool.submit(_download_whisper)]
+        downloads += [pool.submit(_download_alignment, lang) for lang in align_languages]
+        for download in downloads:
+            download.result()
 
     # ========================================================================
     # Note: Volume changes are auto-committed in background (Modal 2025)
@@ -134,7 +185,7 @@ def download_whisperx_models():
     return {
         "success": True,
         "whisper_model": "large-v3-turbo",
-        "alignment_model": "wav2vec2 (en)",
+        "alignment_model": f"wav2vec2 ({', '.join(align_languages)})",
         "device": device,
         "cache_path": "/models/hf_cache",
     }
@@ -149,7 +200,7 @@ def main():
     print()
     print("This will download the following models (~4GB total):")
     print("  1. WhisperX large-v3-turbo (~3GB)")
-    print("  2. Wav2Vec2 alignment model (~1.2GB)")
+    print("  2. Wav2Vec2 alignment models (English ~1.2GB + preload languages)")
     print()
     print("Volume: whisperx-models-v1")
     print("GPU: A10G (24GB VRAM)")
@@ -7,13 +7,24 @@ This module provides the core transcription engine using WhisperX with:
 - Multi-language support
 """
 
+import io
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Any, Tuple, Union
 import structlog
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = structlog.get_logger()
 
+# Modal Volume mount holding the model caches
+_VOLUME_ROOT = "/models"
+
 
 # WhisperX supported languages (from faster-whisper)
 # See: https://github.com/openai/whisper/blob/main/whisper/tokenizer.py
@@ -120,6 +131,28 @@ SUPPORTED_LANGUAGES = {
 }
 
 
+# Built once: validation membership set, read-only view for callers, and the
+# preview list used in the unsupported-language error
+_SUPPORTED_CODES = frozenset(SUPPORTED_LANGUAGES)
+_SUPPORTED_LANGUAGES_VIEW = MappingProxyType(SUPPORTED_LANGUAGES)
+_SUPPORTED_PREVIEW = ", ".join(list(SUPPORTED_LANGUAGES)[:10])
+
+# Transcription batch size: sized from free VRAM at ~800MB per slot
+# (large-v3-turbo at fp16), clamped to this range; WHISPERX_BATCH_SIZE pins it
+_BATCH_SLOT_BYTES = 800 * 1024 * 1024
+_MIN_BATCH_SIZE = 4
+_MAX_BATCH_SIZE = 32
+_DEFAULT_BATCH_SIZE = 16  # CPU, or when VRAM can't be queried
+
+# Pinned staging buffer preallocated at load: 10 minutes of 16kHz float32
+# (~38MB); grown on demand for longer audio
+_PINNED_AUDIO_SAMPLES = 16000 * 600
+
+# Alignment models loaded at startup besides English (comma-separated codes,
+# overridable via WHISPERX_ALIGN_PRELOAD; empty disables preloading)
+DEFAULT_ALIGN_PRELOAD = "es,fr,de,pt,zh"
+
+
 class WhisperXEngine:
     """WhisperX transcription engine with word-level timestamps.
 
@@ -144,6 +177,17 @@ class WhisperXEngine:
         self.whisper_model = None
         self.alignment_model = None
         self.alignment_metadata = None
+        # Resident alignment models by language code: (model, metadata)
+        self.alignment_models: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+        # Languages loaded on demand, kept on the GPU in LRU order
+        self._align_lru: "OrderedDict[str, Tuple[Any, Dict[str, Any]]]" = OrderedDict()
+        self._align_lru_max = 4
+        # Reusable pinned host buffer the audio is staged in for alignment
+        self._pinned_audio = None
+        # Held while an alignment reads from _pinned_audio
+        self._pinned_lock = threading.Lock()
+        # whisperx module, imported in load_models once torch.load is patched
+        self._whisperx = None
 
         self._loaded = False
         self.device = None
@@ -174,20 +218,51 @@ class WhisperXEngine:
                 """Patched torch.load that forces weights_only=False for trusted models."""
                 # Force False even if explicitly passed by libraries (lightning_fabric, etc.)
                 kwargs['weights_only'] = False
+                # Checkpoints on the Volume (including the pyannote VAD, which lightning
+                # hands over as an open file) are read in one large buffered read: mmap
+                # or torch's own reads turn into many small network round trips there
+                f = args[0] if args else kwargs.get('f')
+                path = f if isinstance(f, (str, os.PathLike)) else getattr(f, 'name', None)
+                if (
+                    isinstance(path, (str, os.PathLike))
+                    and os.fspath(path).startswith(_VOLUME_ROOT)
+                    and os.path.isfile(path)
+                ):
+                    with open(path, 'rb') as checkpoint:
+                        buffer = io.BytesIO(checkpoint.read())
+                    rest = {k: v for k, v in kwargs.items() if k not in ('f', 'mmap')}
+                    return _original_torch_load(buffer, *args[1:], **rest)
                 return _original_torch_load(*args, **kwargs)
 
             # Apply monkey patch globally
             torch.load = _patched_torch_load
 
-            import whisperx
-
-            # Set cache directories (HuggingFace models)
+            # Set cache directories (HuggingFace models) before whisperx pulls
+            # in transformers, which reads them at import time
             os.environ["HF_HUB_CACHE"] = str(self.cache_dir)
             os.environ["HF_HOME"] = str(self.cache_dir)
+            # torchaudio pipeline bundles (the alignment models for en/fr/de/
+            # es/it) download here; on the Volume they survive cold starts
+            os.environ["TORCH_HOME"] = str(Path(_VOLUME_ROOT) / "torch_cache")
+            # Read safetensors shards on a thread pool (transformers-backed
+            # alignment models); overlaps Volume reads with tensor construction
+            os.environ.setdefault("HF_ENABLE_PARALLEL_LOADING", "true")
+            os.environ.setdefault("HF_PARALLEL_LOADING_WORKERS", "8")
+
+            import whisperx
+
+            # Bound once here (after the patches above); request paths use it
+            # instead of re-running the import statement
+            self._whisperx = whisperx
 
             # Determine device and compute type
             self.device = "cuda" if torch.cuda.is_available() else "cpu"
-            self.compute_type = "float16" if self.device == "cuda" else "int8"
+            # int8 weights with fp16 activations on GPU: half the weight
+            # bandwidth of float16 for the decoder; WHISPERX_COMPUTE_TYPE overrides
+            self.compute_type = os.environ.get(
+                "WHISPERX_COMPUTE_TYPE",
+                "int8_float16" if self.device == "cuda" else "int8",
+            )
 
             logger.info(
                 "whisperx_engine.loading",
@@ -228,6 +303,19 @@ class WhisperXEngine:
                 language="en",
                 metadata=self.alignment_metadata,
             )
+            self.alignment_models["en"] = (self.alignment_model, self.alignment_metadata)
+
+            # Other common languages, so their first request doesn't pay the load
+            self._preload_alignment_models(whisperx)
+
+            # Allocate the pinned staging buffer now rather than on a request
+            if self.device == "cuda":
+                self._pinned_audio = torch.empty(
+                    _PINNED_AUDIO_SAMPLES, dtype=torch.float32, pin_memory=True
+                )
+
+            # One throwaway pass so CUDA/cuDNN setup isn't paid by the first request
+            self._warm_up(whisperx)
 
             # ================================================================
             # Mark as loaded
@@ -246,6 +334,157 @@ class WhisperXEngine:
             logger.error("whisperx_engine.load_failed", error=str(e))
             raise RuntimeError(f"Failed to load WhisperX models: {e}") from e
 
+    def _preload_alignment_models(self, whisperx) -> None:
+        """Load alignment models for the preload languages in parallel.
+
+        Languages come from WHISPERX_ALIGN_PRELOAD (default
+        DEFAULT_ALIGN_PRELOAD). A language that fails to load is logged and
+        left to the on-demand path in transcribe().
+
+        Args:
+            whisperx: The imported whisperx module
+        """
+        languages = [
+            code.strip()
+            for code in os.environ.get("WHISPERX_ALIGN_PRELOAD", DEFAULT_ALIGN_PRELOAD).split(",")
+            if code.strip() and code.strip() not in self.alignment_models
+        ]
+        if not languages:
+            return
+
+        logger.info("whisperx_engine.preloading_alignment", languages=languages)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                code: pool.submit(whisperx.load_align_model, language_code=code, device=self.device)
+                for code in languages
+            }
+
+        for code, future in futures.items():
+            try:
+                self.alignment_models[code] = future.result()
+            except Exception as e:
+                logger.warning(
+                    "whisperx_engine.alignment_preload_failed",
+                    language=code,
+                    error=str(e),
+                )
+
+        logger.info(
+            "whisperx_engine.alignment_preloaded",
+            languages=sorted(self.alignment_models),
+        )
+
+    def _warm_up(self, whisperx) -> None:
+        """Run a dummy transcribe + align on one second of silence.
+
+        Initializes the CUDA context, cuBLAS/cuDNN handles and kernel caches
+        ahead of the first real request. Failures are logged, not raised: a
+        cold first request is better than a container that won't start.
+
+        Args:
+            whisperx: The imported whisperx module
+        """
+        import numpy as np
+
+        silence = np.zeros(16000, dtype=np.float32)
+        try:
+            self.whisper_model.transcribe(silence, batch_size=1, language="en")
+            whisperx.align(
+                [{"text": "a", "start": 0.0, "end": 1.0}],
+                self.alignment_model,
+                self.alignment_metadata,
+                self._stage_audio(silence),
+                self.device,
+                return_char_alignments=False,
+            )
+            logger.info("whisperx_engine.warmed_up")
+        except Exception as e:
+            logger.warning("whisperx_engine.warm_up_failed", error=str(e))
+
+    def _stage_audio(self, audio: "np.ndarray"):
+        """Audio to hand to whisperx.align, staged in pinned memory on GPU.
+
+        align() slices the waveform per segment and copies each slice to the
+        device; from page-locked memory those copies skip the driver's
+        bounce buffer. On CPU the array is returned unchanged.
+        """
+        if self.device != "cuda":
+            return audio
+
+        import torch
+
+        if self._pinned_audio is None or len(self._pinned_audio) < len(audio):
+            self._pinned_audio = torch.empty(
+                max(len(audio), _PINNED_AUDIO_SAMPLES),
+                dtype=torch.float32,
+                pin_memory=True,
+            )
+
+        staged = self._pinned_audio[:len(audio)]
+        staged.copy_(torch.from_numpy(audio))
+        return staged
+
+    def _get_aligner(self, language: str) -> Tuple[Any, Dict[str, Any]]:
+        """Return (model, metadata) for a language's alignment model.
+
+        Preloaded models are always resident; others are loaded on first use
+        and kept on the GPU in a small LRU, so repeat requests in the same
+        language skip the reload.
+
+        Args:
+            language: Language code
+        """
+        aligner = self.alignment_models.get(language)
+        if aligner is not None:
+            return aligner
+
+        aligner = self._align_lru.get(language)
+        if aligner is not None:
+            self._align_lru.move_to_end(language)
+            return aligner
+
+        whisperx = self._whisperx
+
+        logger.info("whisperx_engine.loading_alignment", language=language)
+
+        # Load language-specific alignment model (from cache)
+        aligner = whisperx.load_align_model(
+            language_code=language,
+            device=self.device,
+        )
+
+        self._align_lru[language] = aligner
+        if len(self._align_lru) > self._align_lru_max:
+            evicted, _ = self._align_lru.popitem(last=False)
+            logger.info("whisperx_engine.alignment_evicted", language=evicted)
+
+        return aligner
+
+    def _batch_size(self) -> int:
+        """Pick the WhisperX batch size for the next transcription.
+
+        Uses the VRAM actually free right now, so resident alignment models
+        shrink the batch instead of risking OOM, and an idle GPU gets more
+        chunks per encoder pass.
+        """
+        override = os.environ.get("WHISPERX_BATCH_SIZE")
+        if override:
+            return int(override)
+
+        if self.device != "cuda":
+            return _DEFAULT_BATCH_SIZE
+
+        try:
+            import torch
+
+            free_bytes, _ = torch.cuda.mem_get_info()
+        except Exception as e:
+            logger.warning("whisperx_engine.vram_query_failed", error=str(e))
+            return _DEFAULT_BATCH_SIZE
+
+        return max(_MIN_BATCH_SIZE, min(_MAX_BATCH_SIZE, int(free_bytes // _BATCH_SLOT_BYTES)))
+
     def transcribe(
         self,
         audio_path: str,
@@ -267,35 +506,67 @@ class WhisperXEngine:
             RuntimeError: If transcription or alignment fails
             ValueError: If language is invalid
         """
+        return self._transcribe(audio_path, language)
+
+    def transcribe_audio(
+        self,
+        audio: "np.ndarray",
+        language: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Transcribe already-decoded audio with word-level timestamps.
+
+        Same as transcribe(), for uploads decoded in memory (16kHz mono
+        float32, as returned by audio_utils.decode_audio), so no file has to
+        be written and read back.
+
+        Args:
+            audio: 16kHz mono float32 samples in [-1, 1]
+            language: Language code (e.g., "en", "es"). Auto-detected if None.
+
+        Returns:
+            Same dictionary as transcribe()
+
+        Raises:
+            RuntimeError: If transcription or alignment fails
+            ValueError: If language is invalid
+        """
+        return self._transcribe(audio, language)
+
+    def _transcribe(
+        self,
+        source: Union[str, "np.ndarray"],
+        language: Optional[str],
+    ) -> Dict[str, Any]:
+        """Shared body of transcribe() and transcribe_audio()."""
         if not self._loaded:
             raise RuntimeError("Models not loaded. Call load_models() first.")
 
-        if language and language not in SUPPORTED_LANGUAGES:
+        if language and language not in _SUPPORTED_CODES:
             raise ValueError(
                 f"Unsupported language: {language}. "
-                f"Supported languages: {', '.join(list(SUPPORTED_LANGUAGES.keys())[:10])}..."
+                f"Supported languages: {_SUPPORTED_PREVIEW}..."
             )
 
         try:
-            import whisperx
+            whisperx = self._whisperx
 
             logger.info(
                 "whisperx_engine.transcribe.start",
-                audio_path=audio_path,
+                audio_path=source if isinstance(source, str) else None,
                 language=language or "auto",
             )
 
             # ================================================================
-            # 1. Load audio
+            # 1. Load audio (unless the caller already decoded it)
             # ================================================================
-            audio = whisperx.load_audio(audio_path)
+            audio = whisperx.load_audio(source) if isinstance(source, str) else source
 
             # ================================================================
             # 2. Transcribe with WhisperX
             # ================================================================
             # batch_size: Number of audio chunks to process in parallel
             # Higher = faster but more VRAM usage
-            batch_size = 16  # Good balance for A10G (24GB VRAM)
+            batch_size = self._batch_size()
 
             result = self.whisper_model.transcribe(
                 audio,
@@ -307,6 +578,7 @@ class WhisperXEngine:
 
             logger.info(
                 "whisperx_engine.transcribe.complete",
+                batch_size=batch_size,
                 segments=len(result.get("segments", [])),
                 language=detected_language,
             )
@@ -316,50 +588,41 @@ class WhisperXEngine:
             # ================================================================
             logger.info("whisperx_engine.align.start", language=detected_language)
 
-            # Load alignment model for detected language (if different from English)
-            alignment_model = self.alignment_model
-            alignment_metadata = self.alignment_metadata
-
-            if detected_language != "en":
-                logger.info(
-                    "whisperx_engine.loading_alignment",
-                    language=detected_language,
-                )
-                # Load language-specific alignment model (from cache)
-                alignment_model, alignment_metadata = whisperx.load_align_model(
-                    language_code=detected_language,
-                    device=self.device,
+            alignment_model, alignment_metadata = self._get_aligner(detected_language)
+
+            # Perform forced alignment. The pinned buffer is shared, so a
+            # request that overlaps another aligns from pageable memory instead
+            pinned = self._pinned_lock.acquire(blocking=False)
+            try:
+                result = whisperx.align(
+                    result["segments"],
+                    alignment_model,
+                    alignment_metadata,
+                    self._stage_audio(audio) if pinned else audio,
+                    self.device,
+                    return_char_alignments=False,  # Word-level only
                 )
+            finally:
+                if pinned:
+                    self._pinned_lock.release()
 
-            # Perform forced alignment
-            result = whisperx.align(
-                result["segments"],
-                alignment_model,
-                alignment_metadata,
-                audio,
-                self.device,
-                return_char_alignments=False,  # Word-level only
-            )
+            segments = result.get("segments", [])
 
             logger.info(
                 "whisperx_engine.align.complete",
-                segments=len(result.get("segments", [])),
-                has_words=any(
-                    "words" in seg for seg in result.get("segments", [])
-                ),
+                segments=len(segments),
+                has_words=any("words" in seg for seg in segments),
             )
 
             # ================================================================
             # 4. Extract full text and segments
             # ================================================================
-            full_text = " ".join(
-                seg.get("text", "").strip()
-                for seg in result.get("segments", [])
-            ).strip()
+            texts = (seg.get("text", "").strip() for seg in segments)
+            full_text = " ".join([text for text in texts if text])
 
             return {
                 "text": full_text,
-                "segments": result.get("segments", []),
+                "segments": segments,
                 "language": detected_language,
             }
 
@@ -367,13 +630,13 @@ class WhisperXEngine:
             logger.error("whisperx_engine.transcribe.failed", error=str(e))
             raise RuntimeError(f"Transcription failed: {e}") from e
 
-    def get_supported_languages(self) -> Dict[str, str]:
-        """Get dictionary of supported languages.
+    def get_supported_languages(self) -> Mapping[str, str]:
+        """Get supported languages.
 
         Returns:
-            Dictionary mapping language codes to language names
+            Read-only mapping of language codes to language names
         """
-        return SUPPORTED_LANGUAGES.copy()
+        return _SUPPORTED_LANGUAGES_VIEW
 
     def is_gpu_available(self) -> bool:
         """Check if GPU is available.
@@ -33,6 +33,7 @@ image = (
         "fastapi[standard]>=0.108.0",
         "pydantic>=2.5.0",
         "python-multipart",  # For file uploads
+        "orjson",  # Fast JSON serialization (default response class, /transcribe)
     )
     .run_commands("apt-get update && apt-get install -y ffmpeg git")
     # Install WhisperX from official GitHub repo (fixes yanked PyPI version issue)
@@ -61,6 +62,8 @@ def fastapi_app():
     The returned FastAPI app handles all HTTP requests.
     """
     from fastapi import FastAPI
+    from fastapi.responses import ORJSONResponse
+    import asyncio
     import structlog
     import os
     from whisper_service.routes import create_routes
@@ -69,6 +72,11 @@ def fastapi_app():
     # Set HuggingFace cache to volume path
     os.environ["HF_HUB_CACHE"] = "/models/hf_cache"
     os.environ["HF_HOME"] = "/models/hf_cache"
+    # torchaudio alignment bundles, same location download_models.py fills
+    os.environ["TORCH_HOME"] = "/models/torch_cache"
+    # Parallel safetensors shard loading, set before transformers is imported
+    os.environ.setdefault("HF_ENABLE_PARALLEL_LOADING", "true")
+    os.environ.setdefault("HF_PARALLEL_LOADING_WORKERS", "8")
 
     # Configure structlog
     structlog.configure(
@@ -89,6 +97,7 @@ def fastapi_app():
         version="0.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
     )
 
     # CORS middleware
@@ -101,24 +110,42 @@ def fastapi_app():
         allow_headers=["*"],
     )
 
+    # Word-level /transcribe JSON is large and compresses well
+    from fastapi.middleware.gzip import GZipMiddleware
+    web_app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # Initialize engine (global per container)
     engine = WhisperXEngine(cache_dir="/models/hf_cache")
 
+    def _models_loaded(future) -> None:
+        """Log the outcome of the background model load."""
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is not None:
+            logger.error("fastapi.startup.failed", error=str(error))
+            return
+
+        logger.info(
+            "fastapi.startup.models_loaded",
+            gpu_available=engine.is_gpu_available(),
+            alignment_available=engine.is_alignment_available(),
+        )
+
     # Startup event: Pre-load models
     @web_app.on_event("startup")
     async def startup():
-        """Pre-load WhisperX models on container startup."""
+        """Start loading WhisperX models on container startup.
+
+        The load runs on a worker thread so the event loop stays free (and
+        /health answers) while weights stream from the Volume; /transcribe
+        waits on web_app.state.models_ready.
+        """
         logger.info("fastapi.startup")
-        try:
-            engine.load_models()
-            logger.info(
-                "fastapi.startup.models_loaded",
-                gpu_available=engine.is_gpu_available(),
-                alignment_available=engine.is_alignment_available(),
-            )
-        except Exception as e:
-            logger.error("fastapi.startup.failed", error=str(e))
-            raise
+        loop = asyncio.get_running_loop()
+        web_app.state.models_ready = loop.run_in_executor(None, engine.load_models)
+        web_app.state.models_ready.add_done_callback(_models_loaded)
 
     # Register routes
     create_routes(app=web_app, engine=engine)
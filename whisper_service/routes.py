@@ -1,7 +1,11 @@
 """FastAPI routes for WhisperX STT API."""
 
+import asyncio
+import functools
+import os
 from typing import Optional
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+import orjson
+from fastapi import Depends, FastAPI, File, UploadFile, Form, HTTPException, Request, Response
 from fastapi.responses import JSONResponse
 import structlog
 
@@ -10,15 +14,48 @@ from whisper_service.models import (
     HealthResponse,
     LanguagesResponse,
     LanguageInfo,
-    Segment,
-    WordSegment,
     APIInfoResponse,
     APIEndpointInfo,
 )
-from whisper_service.utils.audio_utils import convert_to_wav, cleanup_temp_file
+from whisper_service.utils.audio_utils import decode_audio
+from whisper_service.utils.result_cache import TranscriptionCache
 
 logger = structlog.get_logger()
 
+# /languages and /api-info only change with a deploy
+_STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+# Upload extensions passed to ffmpeg as a format hint; anything else is "auto"
+_KNOWN_FORMATS = frozenset({
+    "wav", "mp3", "m4a", "mp4", "mov", "3gp", "3g2",
+    "flac", "ogg", "oga", "opus", "webm", "aac", "wma",
+})
+
+
+def _json_response(body: bytes, cache_status: str) -> Response:
+    """Pre-serialized /transcribe JSON with its X-Cache header."""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"X-Cache": cache_status},
+    )
+
+
+async def _require_models(request: Request) -> None:
+    """Wait for the startup model load to finish (503 if it failed)."""
+    models_ready = getattr(request.app.state, "models_ready", None)
+    if models_ready is None:
+        return
+
+    try:
+        # Shielded: a disconnecting client must not cancel the shared load
+        await asyncio.shield(models_ready)
+    except Exception as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Models failed to load: {str(e)}",
+        )
+
 
 def create_routes(app: FastAPI, engine) -> None:
     """Register all API routes.
@@ -50,6 +87,19 @@ def create_routes(app: FastAPI, engine) -> None:
     # ========================================================================
     # Languages Endpoint
     # ========================================================================
+    # The language list is static, so the sorted response is built once
+    languages = sorted(
+        (
+            LanguageInfo(code=code, name=name)
+            for code, name in engine.get_supported_languages().items()
+        ),
+        key=lambda x: x.name,  # Sort by language name
+    )
+    languages_response = LanguagesResponse(
+        languages=languages,
+        total=len(languages),
+    )
+
     @app.get(
         "/languages",
         response_model=LanguagesResponse,
@@ -57,26 +107,20 @@ def create_routes(app: FastAPI, engine) -> None:
         description="Get list of all languages supported by WhisperX",
         tags=["Info"],
     )
-    async def get_languages():
+    async def get_languages(response: Response):
         """Get list of supported languages."""
-        languages_dict = engine.get_supported_languages()
-
-        languages = [
-            LanguageInfo(code=code, name=name)
-            for code, name in languages_dict.items()
-        ]
-
-        # Sort by language name
-        languages.sort(key=lambda x: x.name)
-
-        return LanguagesResponse(
-            languages=languages,
-            total=len(languages),
-        )
+        response.headers["Cache-Control"] = _STATIC_CACHE_CONTROL
+        return languages_response
 
     # ========================================================================
     # Transcribe Endpoint
     # ========================================================================
+    # Transcriptions allowed on the GPU at once; uploads and decoding of
+    # waiting requests overlap with the running one
+    gpu_slots = asyncio.Semaphore(int(os.environ.get("WHISPER_GPU_CONCURRENCY", "1")))
+    # Finished responses by upload content + language
+    result_cache = TranscriptionCache()
+
     @app.post(
         "/transcribe",
         response_model=TranscribeResponse,
@@ -87,6 +131,7 @@ def create_routes(app: FastAPI, engine) -> None:
             "Language is auto-detected by default, or can be specified manually."
         ),
         tags=["Transcription"],
+        dependencies=[Depends(_require_models)],
     )
     async def transcribe_audio(
         file: UploadFile = File(
@@ -111,7 +156,6 @@ def create_routes(app: FastAPI, engine) -> None:
         Raises:
             HTTPException: If transcription fails
         """
-        wav_path = None
         try:
             # ================================================================
             # 1. Read uploaded file
@@ -123,84 +167,101 @@ def create_routes(app: FastAPI, engine) -> None:
                 language=language or "auto",
             )
 
-            audio_bytes = await file.read()
+            # Starlette has already spooled the upload to a temp file; hand
+            # that to ffmpeg directly instead of reading it into memory
+            upload = file.file
+            upload_size = upload.seek(0, os.SEEK_END)
+            upload.seek(0)
 
-            if not audio_bytes:
+            if not upload_size:
                 raise HTTPException(
                     status_code=400,
                     detail="Uploaded file is empty",
                 )
 
+            # Repeat uploads are answered from memory, skipping decode and GPU
+            loop = asyncio.get_running_loop()
+            cache_key = await loop.run_in_executor(
+                None, TranscriptionCache.make_key, upload, language
+            )
+            cached_body = result_cache.get(cache_key)
+            if cached_body is not None:
+                logger.info("routes.transcribe.cache_hit", response_size=len(cached_body))
+                return _json_response(cached_body, "hit")
+
             # ================================================================
-            # 2. Convert to WAV (16kHz mono)
+            # 2. Decode to 16kHz mono samples
             # ================================================================
             # Extract file extension for format hint
-            source_format = "auto"
-            if file.filename:
-                parts = file.filename.rsplit(".", 1)
-                if len(parts) == 2:
-                    source_format = parts[1].lower()
+            _, dot, extension = (file.filename or "").rpartition(".")
+            extension = extension.lower()
+            source_format = extension if dot and extension in _KNOWN_FORMATS else "auto"
 
-            wav_path, duration = convert_to_wav(audio_bytes, source_format)
+            # ffmpeg runs on a worker thread (it blocks in subprocess, which
+            # releases the GIL) so /health keeps answering meanwhile
+            audio, duration = await loop.run_in_executor(
+                None, decode_audio, upload, source_format
+            )
 
             logger.info(
                 "routes.transcribe.converted",
-                wav_path=wav_path,
+                samples=len(audio),
                 duration=duration,
             )
 
             # ================================================================
             # 3. Transcribe with WhisperX
             # ================================================================
-            result = engine.transcribe(
-                audio_path=wav_path,
-                language=language,
-            )
+            # Blocking GPU work runs on a worker thread, gated by gpu_slots
+            async with gpu_slots:
+                result = await loop.run_in_executor(
+                    None,
+                    functools.partial(engine.transcribe_audio, audio=audio, language=language),
+                )
 
             # ================================================================
             # 4. Format response
             # ================================================================
-            segments = []
-            for seg in result["segments"]:
-                # Extract word-level timestamps
-                words = []
-                if "words" in seg:
-                    for word in seg["words"]:
-                        words.append(
-                            WordSegment(
-                                word=word.get("word", ""),
-                                start=word.get("start", 0.0),
-                                end=word.get("end", 0.0),
-                                score=word.get("score", 0.0),
-                            )
-                        )
-
-                segments.append(
-                    Segment(
-                        text=seg.get("text", "").strip(),
-                        start=seg.get("start", 0.0),
-                        end=seg.get("end", 0.0),
-                        words=words,
-                    )
-                )
+            # Plain dicts in TranscribeResponse's shape, dumped once with
+            # orjson; a long clip has thousands of words, and building a
+            # validated model per word only to serialize it is wasted work
+            segments = [
+                {
+                    "text": seg.get("text", "").strip(),
+                    "start": float(seg.get("start", 0.0)),
+                    "end": float(seg.get("end", 0.0)),
+                    "words": [
+                        {
+                            "word": word.get("word", ""),
+                            "start": float(word.get("start", 0.0)),
+                            "end": float(word.get("end", 0.0)),
+                            "score": float(word.get("score", 0.0)),
+                        }
+                        for word in seg.get("words", ())
+                    ],
+                }
+                for seg in result["segments"]
+            ]
 
-            response = TranscribeResponse(
-                text=result["text"],
-                segments=segments,
-                language=result["language"],
-                duration=duration,
-            )
+            body = orjson.dumps({
+                "text": result["text"],
+                "segments": segments,
+                "language": result["language"],
+                "duration": float(duration),
+            })
 
             logger.info(
                 "routes.transcribe.complete",
                 text_length=len(result["text"]),
                 segments=len(segments),
-                total_words=sum(len(s.words) for s in segments),
+                total_words=sum(len(s["words"]) for s in segments),
                 language=result["language"],
                 duration=duration,
             )
 
-            return response
+            result_cache.put(cache_key, body)
+
+            return _json_response(body, "miss")
 
         except HTTPException:
             raise
@@ -216,14 +277,70 @@ def create_routes(app: FastAPI, engine) -> None:
                 detail=f"Transcription failed: {str(e)}",
             )
 
-        finally:
-            # Clean up temporary WAV file
-            if wav_path:
-                cleanup_temp_file(wav_path)
-
     # ========================================================================
     # API Info Endpoint
     # ========================================================================
+    # Static documentation, built once
+    api_info_response = APIInfoResponse(
+        service="WhisperX STT API",
+        version="0.1.0",
+        endpoints=[
+            APIEndpointInfo(
+                endpoint="/transcribe",
+                method="POST",
+                description="Transcribe audio with word-level timestamps for karaoke-style highlighting",
+                inputs={
+                    "file": "Audio file (WAV, MP3, M4A, FLAC, etc.) - multipart/form-data",
+                    "language": "Optional language code (en, es, fr, etc.) - auto-detected if not provided",
+                },
+                outputs={
+                    "text": "Full transcribed text",
+                    "segments": "List of segments with word-level timestamps (each word has: word, start, end, score)",
+                    "language": "Detected or specified language code",
+                    "duration": "Audio duration in seconds",
+                },
+                example=(
+                    'curl -X POST "https://[ENDPOINT]/transcribe" \\\n'
+                    '  -F "file=@audio.mp3" \\\n'
+                    '  -F "language=en" | jq'
+                ),
+            ),
+            APIEndpointInfo(
+                endpoint="/languages",
+                method="GET",
+                description="Get list of all 99+ supported languages",
+                outputs={
+                    "languages": "Array of {code: str, name: str} objects",
+                    "total": "Total number of supported languages",
+                },
+                example='curl "https://[ENDPOINT]/languages" | jq',
+            ),
+            APIEndpointInfo(
+                endpoint="/health",
+                method="GET",
+                description="Service health check with GPU and model status",
+                outputs={
+                    "status": "Service status (healthy/unhealthy)",
+                    "model": "Loaded Whisper model (large-v3-turbo)",
+                    "gpu_available": "GPU availability (true/false)",
+                    "alignment_available": "Alignment model availability (true/false)",
+                },
+                example='curl "https://[ENDPOINT]/health" | jq',
+            ),
+            APIEndpointInfo(
+                endpoint="/api-info",
+                method="GET",
+                description="Get this API documentation",
+                outputs={
+                    "service": "Service name",
+                    "version": "API version",
+                    "endpoints": "Array of endpoint documentation objects",
+                },
+                example='curl "https://[ENDPOINT]/api-info" | jq',
+            ),
+        ],
+    )
+
     @app.get(
         "/api-info",
         response_model=APIInfoResponse,
@@ -231,64 +348,7 @@ def create_routes(app: FastAPI, engine) -> None:
         description="Get comprehensive API documentation for all endpoints",
         tags=["Info"],
     )
-    async def api_info():
+    async def api_info(response: Response):
         """Get API usage documentation for all endpoints."""
-        return APIInfoResponse(
-            service="WhisperX STT API",
-            version="0.1.0",
-            endpoints=[
-                APIEndpointInfo(
-                    endpoint="/transcribe",
-                    method="POST",
-                    description="Transcribe audio with word-level timestamps for karaoke-style highlighting",
-                    inputs={
-                        "file": "Audio file (WAV, MP3, M4A, FLAC, etc.) - multipart/form-data",
-                        "language": "Optional language code (en, es, fr, etc.) - auto-detected if not provided",
-                    },
-                    outputs={
-                        "text": "Full transcribed text",
-                        "segments": "List of segments with word-level timestamps (each word has: word, start, end, score)",
-                        "language": "Detected or specified language code",
-                        "duration": "Audio duration in seconds",
-                    },
-                    example=(
-                        'curl -X POST "https://[ENDPOINT]/transcribe" \\\n'
-                        '  -F "file=@audio.mp3" \\\n'
-                        '  -F "language=en" | jq'
-                    ),
-                ),
-                APIEndpointInfo(
-                    endpoint="/languages",
-                    method="GET",
-                    description="Get list of all 99+ supported languages",
-                    outputs={
-                        "languages": "Array of {code: str, name: str} objects",
-                        "total": "Total number of supported languages",
-                    },
-                    example='curl "https://[ENDPOINT]/languages" | jq',
-                ),
-                APIEndpointInfo(
-                    endpoint="/health",
-                    method="GET",
-                    description="Service health check with GPU and model status",
-                    outputs={
-                        "status": "Service status (healthy/unhealthy)",
-                        "model": "Loaded Whisper model (large-v3-turbo)",
-                        "gpu_available": "GPU availability (true/false)",
-                        "alignment_available": "Alignment model availability (true/false)",
-                    },
-                    example='curl "https://[ENDPOINT]/health" | jq',
-                ),
-                APIEndpointInfo(
-                    endpoint="/api-info",
-                    method="GET",
-                    description="Get this API documentation",
-                    outputs={
-                        "service": "Service name",
-                        "version": "API version",
-                        "endpoints": "Array of endpoint documentation objects",
-                    },
-                    example='curl "https://[ENDPOINT]/api-info" | jq',
-                ),
-            ],
-        )
+        response.headers["Cache-Control"] = _STATIC_CACHE_CONTROL
+        return api_info_response
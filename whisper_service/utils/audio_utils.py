@@ -1,143 +1,202 @@
 """Audio processing utilities for WhisperX STT service."""
 
 import io
+import shutil
+import subprocess
 import tempfile
 import os
-from pathlib import Path
-from typing import Tuple
+import wave
+from typing import BinaryIO, Optional, Tuple, Union
+import numpy as np
 import structlog
 
 logger = structlog.get_logger()
 
+# Resolved once instead of a PATH search on every spawn
+_FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
 
-def convert_to_wav(audio_bytes: bytes, source_format: str = "auto") -> Tuple[str, float]:
-    """Convert audio bytes to WAV format suitable for WhisperX.
 
-    WhisperX requires 16kHz mono WAV format. This function accepts any
-    audio format (MP3, M4A, FLAC, WAV, etc.) and converts it using ffmpeg.
+# Containers whose index may sit at the end of the file (MP4 moov atom), so
+# ffmpeg needs a seekable input rather than a pipe. "auto" (no or unknown
+# extension) may be any of these too.
+_SEEKABLE_FORMATS = {"auto", "m4a", "mp4", "mov", "3gp", "3g2"}
+
+# WhisperX input format
+_SAMPLE_RATE = 16000
+
+
+def decode_audio(source: Union[bytes, BinaryIO], source_format: str = "auto") -> Tuple[np.ndarray, float]:
+    """Decode audio to the 16kHz mono float32 samples WhisperX consumes.
+
+    One ffmpeg run from stdin to raw PCM on stdout, so WhisperX doesn't have
+    to decode an intermediate WAV again. A file-backed binary file object
+    (e.g. the upload's spooled temp file) is handed to ffmpeg as its stdin
+    and opened as /dev/stdin, which is seekable, so the upload is never read
+    into Python memory or copied. Bytes go through a pipe, except MP4 family
+    and unknown formats, which need a seekable temp file (see
+    _SEEKABLE_FORMATS). WAVs that are already 16kHz mono PCM16 skip ffmpeg
+    altogether.
 
     Args:
-        audio_bytes: Input audio file bytes
+        source: Input audio file bytes, or a seekable binary file object
         source_format: Source format hint (e.g., "mp3", "m4a"). Use "auto" to detect.
 
     Returns:
-        Tuple of (wav_file_path, duration_seconds)
+        Tuple of (float32 samples in [-1, 1], duration_seconds)
 
     Raises:
-        RuntimeError: If audio conversion fails
-        ValueError: If audio_bytes is empty
+        RuntimeError: If audio decoding fails
+        ValueError: If the input is empty
     """
-    if not audio_bytes:
-        raise ValueError("audio_bytes cannot be empty")
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        input_size = len(source)
+    else:
+        input_size = source.seek(0, os.SEEK_END)
+        source.seek(0)
+
+    if not input_size:
+        raise ValueError("audio input cannot be empty")
+
+    if source_format == "wav":
+        audio = _read_native_wav(source)
+        if audio is not None:
+            duration = len(audio) / _SAMPLE_RATE
+            logger.info(
+                "audio_utils.decode.native_wav",
+                samples=len(audio),
+                duration=duration,
+            )
+            return audio, duration
+
+    stdin_file = None
+    if not isinstance(source, (bytes, bytearray, memoryview)):
+        try:
+            # fileno() rolls a still-in-memory spooled file over to disk
+            source.fileno()
+            stdin_file = source
+        except (AttributeError, io.UnsupportedOperation):
+            source = source.read()
 
+    input_path = None
     try:
-        # Create temp file for input audio
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{source_format}") as input_file:
-            input_file.write(audio_bytes)
-            input_path = input_file.name
-
-        # Create temp file for output WAV
-        output_fd, output_path = tempfile.mkstemp(suffix=".wav")
-        os.close(output_fd)  # Close fd, ffmpeg will open it
+        if stdin_file is None and source_format in _SEEKABLE_FORMATS:
+            suffix = "" if source_format == "auto" else f".{source_format}"
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as input_file:
+                input_file.write(source)
+                input_path = input_file.name
 
         logger.info(
-            "audio_utils.convert.start",
-            input_size=len(audio_bytes),
+            "audio_utils.decode.start",
+            input_size=input_size,
             source_format=source_format,
+            piped=input_path is None and stdin_file is None,
         )
 
-        # Convert to 16kHz mono WAV using ffmpeg
-        # -y: overwrite output file
-        # -i: input file
-        # -ar 16000: 16kHz sample rate (WhisperX requirement)
-        # -ac 1: mono (1 channel)
-        # -c:a pcm_s16le: 16-bit PCM encoding
-        import subprocess
-
+        stdin_bytes = None
+        if stdin_file is not None:
+            # Opening /dev/stdin reopens the underlying file, so ffmpeg can
+            # seek (MP4 moov atom at the end) where pipe:0 could not
+            source_args = ["-nostdin", "-i", "/dev/stdin"]
+        elif input_path:
+            source_args = ["-nostdin", "-i", input_path]
+        else:
+            source_args, stdin_bytes = ["-i", "pipe:0"], source
+
+        # Same output flags as whisperx.load_audio: 16kHz mono 16-bit PCM
         result = subprocess.run(
             [
-                "ffmpeg",
-                "-y",  # Overwrite output
-                "-i", input_path,  # Input file
-                "-ar", "16000",  # 16kHz sample rate
-                "-ac", "1",  # Mono
-                "-c:a", "pcm_s16le",  # 16-bit PCM
-                output_path,  # Output file
+                _FFMPEG,
+                "-hide_banner",
+                "-loglevel", "error",  # stderr only carries failures
+                "-threads", "0",
+                *source_args,
+                "-f", "s16le",
+                "-ac", "1",
+                "-acodec", "pcm_s16le",
+                "-ar", str(_SAMPLE_RATE),
+                "pipe:1",
             ],
+            input=stdin_bytes,
+            stdin=stdin_file,
             capture_output=True,
-            text=True,
             check=True,
         )
 
-        # Get audio duration from ffmpeg output
-        duration = _extract_duration_from_ffmpeg_output(result.stderr)
+        audio = _pcm16_to_float(result.stdout)
+
+        # Exact length of what was decoded (and what WhisperX will see); no
+        # need to scrape the container's Duration line out of stderr
+        duration = len(audio) / _SAMPLE_RATE
 
         logger.info(
-            "audio_utils.convert.complete",
-            output_path=output_path,
+            "audio_utils.decode.complete",
+            samples=len(audio),
             duration=duration,
         )
 
-        # Clean up input file
-        try:
-            os.remove(input_path)
-        except OSError:
-            logger.warning("audio_utils.cleanup_failed", path=input_path)
-
-        return output_path, duration
+        return audio, duration
 
     except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode("utf-8", errors="replace") if e.stderr else ""
         logger.error(
-            "audio_utils.convert.failed",
+            "audio_utils.decode.failed",
             error=str(e),
-            stderr=e.stderr,
+            stderr=stderr,
         )
-        # Clean up temp files
-        if 'input_path' in locals():
-            try:
-                os.remove(input_path)
-            except OSError:
-                pass
-        if 'output_path' in locals():
-            try:
-                os.remove(output_path)
-            except OSError:
-                pass
-
-        raise RuntimeError(f"Audio conversion failed: {e.stderr}") from e
+        raise RuntimeError(f"Audio conversion failed: {stderr}") from e
 
     except Exception as e:
-        logger.error("audio_utils.convert.failed", error=str(e))
+        logger.error("audio_utils.decode.failed", error=str(e))
         raise RuntimeError(f"Audio conversion failed: {e}") from e
 
+    finally:
+        if input_path:
+            cleanup_temp_file(input_path)
 
-def _extract_duration_from_ffmpeg_output(stderr: str) -> float:
-    """Extract audio duration from ffmpeg stderr output.
 
-    Args:
-        stderr: ffmpeg stderr output
+def _read_native_wav(source: Union[bytes, BinaryIO]) -> Optional[np.ndarray]:
+    """Read a WAV that is already 16kHz mono PCM16 without running ffmpeg.
 
-    Returns:
-        Duration in seconds, or 0.0 if not found
+    Returns None (leaving a file object rewound) for anything else, so the
+    caller falls back to ffmpeg for resampling, downmixing and other codecs.
+
+    Args:
+        source: Input audio file bytes, or a seekable binary file object
     """
-    try:
-        # Look for "Duration: HH:MM:SS.ms" in ffmpeg output
-        for line in stderr.split('\n'):
-            if 'Duration:' in line:
-                # Example: "Duration: 00:01:23.45, start: 0.000000, bitrate: 128 kb/s"
-                duration_str = line.split('Duration:')[1].split(',')[0].strip()
-                # Parse HH:MM:SS.ms
-                hours, minutes, seconds = duration_str.split(':')
-                total_seconds = (
-                    int(hours) * 3600 +
-                    int(minutes) * 60 +
-                    float(seconds)
-                )
-                return total_seconds
-    except Exception as e:
-        logger.warning("audio_utils.duration_parse_failed", error=str(e))
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
 
-    return 0.0
+    try:
+        with wave.open(source, "rb") as wav:
+            if (
+                wav.getnchannels() != 1
+                or wav.getsampwidth() != 2
+                or wav.getframerate() != _SAMPLE_RATE
+            ):
+                return None
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return None
+    finally:
+        source.seek(0)
+
+    # Truncated uploads can end mid-sample
+    frames = frames[:len(frames) - len(frames) % 2]
+    return _pcm16_to_float(frames)
+
+
+# 1 / 32768, exact in float32
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _pcm16_to_float(pcm: bytes) -> np.ndarray:
+    """PCM16 bytes to float32 in [-1, 1], with a single array allocation.
+
+    One fused ufunc pass: the int16 -> float32 cast happens inside the
+    multiply loop, so there is no full-length temporary and only one sweep
+    over memory. Same values as ``astype(np.float32) / 32768.0``.
+    """
+    return np.multiply(np.frombuffer(pcm, np.int16), _PCM16_SCALE, dtype=np.float32)
 
 
 def cleanup_temp_file(file_path: str) -> None:
@@ -146,9 +205,14 @@ def cleanup_temp_file(file_path: str) -> None:
     Args:
         file_path: Path to temporary file
     """
-    if file_path and os.path.exists(file_path):
-        try:
-            os.remove(file_path)
-            logger.debug("audio_utils.cleanup", path=file_path)
-        except OSError as e:
-            logger.warning("audio_utils.cleanup_failed", path=file_path, error=str(e))
+    if not file_path:
+        return
+
+    # One unlink rather than exists() + remove()
+    try:
+        os.remove(file_path)
+        logger.debug("audio_utils.cleanup", path=file_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("audio_utils.cleanup_failed", path=file_path, error=str(e))
@@ -0,0 +1,65 @@
+"""Content-addressed cache of /transcribe results.
+
+Clients resend identical clips (retries, tests, duplicate uploads), so
+finished JSON response bodies are kept in an in-memory LRU keyed by a BLAKE2b
+digest of the upload bytes and the requested language. A hit skips both the
+ffmpeg decode and WhisperX.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import BinaryIO, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Read size while hashing an upload
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+class TranscriptionCache:
+    """Memory LRU of serialized transcription responses."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+
+    @staticmethod
+    def make_key(upload: BinaryIO, language: Optional[str]) -> str:
+        """Digest of the upload bytes and language hint (blocking).
+
+        Reads the file in chunks from the start and rewinds it afterwards.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update((language or "auto").encode("utf-8"))
+        hasher.update(b"\x00")
+
+        upload.seek(0)
+        if hasattr(upload, "readinto"):
+            # One pass through a reused buffer: no per-chunk bytes objects
+            buffer = bytearray(_HASH_CHUNK_BYTES)
+            view = memoryview(buffer)
+            while n := upload.readinto(buffer):
+                hasher.update(view[:n])
+        else:
+            # SpooledTemporaryFile before Python 3.11 has no readinto()
+            for chunk in iter(lambda: upload.read(_HASH_CHUNK_BYTES), b""):
+                hasher.update(chunk)
+        upload.seek(0)
+
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a cached JSON body, or None."""
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        """Store a JSON body, evicting the oldest entry."""
+        self._entries[key] = body
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)